@@ -0,0 +1,4 @@
+from . import effects
+from .cache import AssetCache, assets
+from .effects import Effect
+from .transforms import TRANSFORMS
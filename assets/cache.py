@@ -0,0 +1,155 @@
+import hashlib
+import logging
+import os
+from pathlib import Path
+
+from PIL import Image
+
+from display.lru import ByteLRU
+from .transforms import TRANSFORMS
+
+log = logging.getLogger(__name__)
+
+
+def default_cache_dir() -> Path:
+    if os.environ.get("LED_ASSET_CACHE"):
+        return Path(os.environ["LED_ASSET_CACHE"])
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return Path(base) / "led-dashboard" / "assets"
+
+
+class AssetCache:
+    """
+    Decoded, panel-ready RGB images, cached in two tiers:
+
+      1) memory: ByteLRU with a byte budget (PIL images, 4 bytes/pixel)
+      2) disk:   raw RGB files under cache_dir, so a reboot skips PNG
+                 decode + resize; oldest files are evicted over disk_bytes
+
+    Entries are keyed by (source path, mtime, target size, transform name +
+    params). Editing a source file changes its mtime, so the old entry is
+    simply never hit again and ages out.
+    """
+
+    SUFFIX = ".rgb"
+
+    def __init__(self, cache_dir=None, *, mem_bytes: int = 8 * 1024 * 1024,
+                 disk_bytes: int = 64 * 1024 * 1024):
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else default_cache_dir()
+        self.disk_bytes = disk_bytes
+        self.mem = ByteLRU(mem_bytes)
+        self.disk_hits = 0
+        self.decodes = 0
+        self._disk_ok = True
+        self._disk_used = None  # bytes on disk, scanned lazily
+
+    @staticmethod
+    def _key(path: str, size, transform: str, params: dict):
+        st = os.stat(path)
+        return (path, st.st_mtime_ns, tuple(size), transform, tuple(sorted(params.items())))
+
+    def _disk_path(self, key) -> Path:
+        digest = hashlib.sha1(repr(key).encode()).hexdigest()
+        return self.cache_dir / (digest + self.SUFFIX)
+
+    def get(self, path, size, transform: str = "fit", *, effect=None, **params) -> Image.Image:
+        """
+        Panel-ready RGB image for `path`, run through TRANSFORMS[transform]
+        at `size`, optionally with an assets.effects.Effect applied. Returned
+        images are shared: don't modify them in place.
+        """
+        path = os.path.abspath(os.fspath(path))
+        key = self._key(path, size, transform, params)
+
+        if effect is not None:
+            # variants only live in memory: a LUT pass is cheaper than disk I/O
+            fx_key = key + (effect.name,)
+            img = self.mem.get(fx_key)
+            if img is None:
+                img = effect.apply(self._get(path, key, size, transform, params))
+                self.put(fx_key, img)
+            return img
+
+        return self._get(path, key, size, transform, params)
+
+    def _get(self, path, key, size, transform, params) -> Image.Image:
+        img = self.mem.get(key)
+        if img is not None:
+            return img
+
+        img = self._read_disk(key, size)
+        if img is None:
+            with Image.open(path) as src:
+                img = TRANSFORMS[transform](src, tuple(size), **params)
+            self.decodes += 1
+            self._write_disk(key, img)
+
+        self.put(key, img)
+        return img
+
+    def put(self, key, img: Image.Image):
+        """Add a derived image (e.g. an effect variant) to the memory tier."""
+        w, h = img.size
+        self.mem.put(key, img, w * h * 4)
+
+    # ---------- disk tier ----------
+
+    def _read_disk(self, key, size):
+        if not self._disk_ok:
+            return None
+        p = self._disk_path(key)
+        try:
+            data = p.read_bytes()
+        except OSError:
+            return None
+        w, h = size
+        if len(data) != w * h * 3:
+            return None  # truncated/corrupt; will be rewritten
+        try:
+            os.utime(p)  # bump for LRU eviction
+        except OSError:
+            pass
+        self.disk_hits += 1
+        return Image.frombytes("RGB", (w, h), data)
+
+    def _write_disk(self, key, img: Image.Image):
+        if not self._disk_ok:
+            return
+        p = self._disk_path(key)
+        tmp = p.with_suffix(".tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            data = img.tobytes()
+            tmp.write_bytes(data)
+            os.replace(tmp, p)  # readers never see a half-written file
+        except OSError as e:
+            log.warning("asset cache disabled (%s): %s", self.cache_dir, e)
+            self._disk_ok = False
+            return
+        self._evict_disk(len(data))
+
+    def _evict_disk(self, added: int):
+        if self._disk_used is None:
+            self._disk_used = sum(f.stat().st_size for f in self.cache_dir.glob("*" + self.SUFFIX))
+        else:
+            self._disk_used += added
+        if self._disk_used <= self.disk_bytes:
+            return
+
+        files = sorted(self.cache_dir.glob("*" + self.SUFFIX), key=lambda f: f.stat().st_mtime)
+        for f in files:
+            if self._disk_used <= self.disk_bytes:
+                break
+            try:
+                size = f.stat().st_size
+                f.unlink()
+                self._disk_used -= size
+            except OSError:
+                pass
+
+    def stats(self) -> dict:
+        return {"memory": self.mem.stats(), "disk_hits": self.disk_hits, "decodes": self.decodes,
+                "disk_bytes": self._disk_used, "cache_dir": str(self.cache_dir)}
+
+
+assets = AssetCache()
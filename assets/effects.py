@@ -0,0 +1,58 @@
+"""
+Image effects as per-channel lookup tables.
+
+An Effect is a (3, 256) uint8 table: output = lut[channel][input]. Applying
+one is a single vectorized gather over the image, and effects chain by
+composing their tables, so invert+dim costs the same as either alone.
+Variants are cached by AssetCache.get(..., effect=...), so a screen only
+pays for an effect once per image.
+"""
+import numpy as np
+from PIL import Image
+
+_RAMP = np.arange(256, dtype=np.float64)
+_CHANNELS = np.arange(3)
+
+
+class Effect:
+    __slots__ = ("name", "lut")
+
+    def __init__(self, name: str, lut):
+        self.name = name  # doubles as the cache key, so it must encode the params
+        self.lut = np.ascontiguousarray(lut, dtype=np.uint8).reshape(3, 256)
+
+    def __repr__(self):
+        return f"Effect({self.name})"
+
+    def then(self, other: "Effect") -> "Effect":
+        """This effect followed by `other`, as one table."""
+        return Effect(f"{self.name}+{other.name}", other.lut[_CHANNELS[:, None], self.lut])
+
+    def apply_array(self, arr):
+        # (3,) channel index broadcasts against (h, w, 3) pixel values
+        return self.lut[_CHANNELS, arr]
+
+    def apply(self, img: Image.Image) -> Image.Image:
+        return Image.fromarray(self.apply_array(np.asarray(img.convert("RGB"))), "RGB")
+
+
+def _table(values) -> np.ndarray:
+    return np.clip(np.rint(values), 0, 255).astype(np.uint8)
+
+
+def invert() -> Effect:
+    return Effect("invert", np.tile(255 - np.arange(256, dtype=np.uint8), (3, 1)))
+
+
+def brightness(scale: float) -> Effect:
+    return Effect(f"brightness({scale:g})", np.tile(_table(_RAMP * scale), (3, 1)))
+
+
+def tint(red: int, green: int, blue: int) -> Effect:
+    """Multiply each channel by color/255 (white -> the tint color)."""
+    rows = [_table(_RAMP * (c / 255.0)) for c in (red, green, blue)]
+    return Effect(f"tint({red},{green},{blue})", np.stack(rows))
+
+
+def gamma(g: float) -> Effect:
+    return Effect(f"gamma({g:g})", np.tile(_table(255.0 * (_RAMP / 255.0) ** g), (3, 1)))
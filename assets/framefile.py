@@ -0,0 +1,140 @@
+"""
+Packed-RGB animation container (".ledf"), read through mmap.
+
+Layout (little-endian):
+
+    header   32 bytes   see HEADER below
+    frames   count * width * height * 3 bytes, packed RGB, row-major
+    delays   count * u16 milliseconds (optional, at delay_offset)
+
+Every frame has the same size, so frame i is a fixed offset into the
+mapping: nothing is loaded up front and the OS pages frames in (and out)
+as they're played. A clip with thousands of frames costs address space,
+not RAM.
+
+Convert PNG sequences or GIFs with:
+
+    python -m assets.framefile -o clip.ledf --size 64x32 anim.gif
+    python -m assets.framefile -o clip.ledf --size 64x32 --fps 12 frame*.png
+"""
+import argparse
+import mmap
+import struct
+
+import numpy as np
+from PIL import Image
+
+from . import sources
+
+MAGIC = b"LEDF"
+VERSION = 1
+# magic, version, width, height, channels, reserved, count,
+# default_delay_ms, data_offset, delay_offset, padding
+HEADER = struct.Struct("<4sHHHBBIHII6x")
+DELAY = struct.Struct("<H")
+
+
+class FrameFile:
+    def __init__(self, path):
+        self.path = str(path)
+        self._file = open(self.path, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            self._file.close()
+            raise ValueError(f"Not a frame file: {self.path}")
+
+        (magic, version, self.width, self.height, channels, _, self.count,
+         default_ms, self.data_offset, delay_offset) = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION or channels != 3:
+            self.close()
+            raise ValueError(f"Not a v{VERSION} packed-RGB frame file: {self.path}")
+
+        self.frame_bytes = self.width * self.height * 3
+        self.size = (self.width, self.height)
+        if self.data_offset + self.count * self.frame_bytes > len(self._mm):
+            self.close()
+            raise ValueError(f"Truncated frame file: {self.path}")
+
+        if delay_offset:
+            ms = np.frombuffer(self._mm, dtype="<u2", count=self.count, offset=delay_offset)
+            self.delays = [max(1, int(v)) / 1000.0 for v in ms]
+        else:
+            self.delays = [max(1, default_ms) / 1000.0] * self.count
+
+        self._view = memoryview(self._mm)
+        # one (h, w, 3) view over every frame; indexing it copies nothing
+        self._frames = np.frombuffer(self._mm, dtype=np.uint8, count=self.count * self.frame_bytes,
+                                     offset=self.data_offset).reshape(self.count, self.height, self.width, 3)
+
+    def __len__(self):
+        return self.count
+
+    def array(self, i: int):
+        """Frame i as a read-only (h, w, 3) view into the mapping."""
+        return self._frames[i]
+
+    def image(self, i: int) -> Image.Image:
+        """Frame i as a PIL image (a raw RGB unpack, no decode)."""
+        off = self.data_offset + i * self.frame_bytes
+        return Image.frombuffer("RGB", self.size, self._view[off:off + self.frame_bytes], "raw", "RGB", 0, 1)
+
+    def close(self):
+        self._frames = None
+        try:
+            if getattr(self, "_view", None) is not None:
+                self._view.release()
+            self._mm.close()
+        except (AttributeError, BufferError):
+            pass  # a caller still holds a view; the GC will unmap it
+        self._file.close()
+
+
+def write_frames(path, frames, size, *, default_delay_s: float = 0.1) -> int:
+    """
+    Write (image, delay_s) pairs to a frame file, streaming: only one frame
+    is in memory at a time. Images must already be RGB at `size`.
+    Returns the number of frames written.
+    """
+    w, h = size
+    delays = []
+    with open(path, "wb") as f:
+        f.write(b"\0" * HEADER.size)  # placeholder until we know the count
+        for img, delay in frames:
+            if img.size != (w, h) or img.mode != "RGB":
+                raise ValueError(f"frame {len(delays)} is {img.mode} {img.size}, expected RGB {(w, h)}")
+            f.write(img.tobytes())
+            delays.append(delay)
+
+        delay_offset = f.tell()
+        for d in delays:
+            f.write(DELAY.pack(min(0xFFFF, max(1, int(round(d * 1000))))))
+
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, VERSION, w, h, 3, 0, len(delays),
+                            int(round(default_delay_s * 1000)), HEADER.size, delay_offset))
+    return len(delays)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Convert a GIF or PNG sequence to a .ledf frame file.")
+    ap.add_argument("inputs", nargs="+", help="one GIF, or PNG frames in play order")
+    ap.add_argument("-o", "--out", required=True)
+    ap.add_argument("--size", default="64x32", help="panel size WxH")
+    ap.add_argument("--fps", type=float, default=10.0, help="frame rate for PNG sequences")
+    ap.add_argument("--smooth", action="store_true", help="bicubic instead of nearest scaling")
+    args = ap.parse_args(argv)
+
+    size = tuple(int(v) for v in args.size.lower().split("x"))
+    if len(args.inputs) == 1 and args.inputs[0].lower().endswith(".gif"):
+        src = sources.gif_frames(args.inputs[0])
+    else:
+        src = sources.png_frames(args.inputs, 1.0 / args.fps)
+
+    n = write_frames(args.out, sources.fitted(src, size, nearest=not args.smooth), size,
+                     default_delay_s=1.0 / args.fps)
+    print(f"wrote {n} frames ({size[0]}x{size[1]}) to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
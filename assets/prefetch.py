@@ -0,0 +1,74 @@
+import logging
+import queue
+import threading
+
+log = logging.getLogger(__name__)
+
+
+class Prefetcher:
+    """
+    Decodes frames ahead of playback on a background thread.
+
+    `source` is a zero-argument callable returning a fresh iterator of
+    (frame, delay_s) pairs; it's called again each time the clip runs out,
+    so playback loops. At most `depth` decoded frames are ever buffered, so
+    memory stays flat however long the clip is. The consumer side never
+    blocks: get() returns None when the decoder is behind.
+    """
+
+    def __init__(self, source, depth: int = 4):
+        self.source = source
+        self.depth = max(1, depth)
+        self._q = None
+        self._stop = None  # each run gets its own Event and queue
+        self._thread = None
+        self.underruns = 0  # get() calls that found the buffer empty
+
+    def start(self):
+        if self._thread is not None:
+            return
+        # fresh per run: a thread stop() gave up waiting for keeps seeing
+        # its own (set) Event and dies on its own, instead of being revived
+        self._q = queue.Queue(maxsize=self.depth)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(self._q, self._stop),
+                                        name="prefetch", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._stop is not None:
+            self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        self._q = None  # drop buffered frames
+
+    def get(self):
+        q = self._q
+        if q is None:
+            return None
+        try:
+            return q.get_nowait()
+        except queue.Empty:
+            self.underruns += 1
+            return None
+
+    def _run(self, q, stop):
+        try:
+            while not stop.is_set():
+                produced = False
+                for item in self.source():
+                    produced = True
+                    # bounded put that still notices stop()
+                    while not stop.is_set():
+                        try:
+                            q.put(item, timeout=0.1)
+                            break
+                        except queue.Full:
+                            pass
+                    if stop.is_set():
+                        return
+                if not produced:
+                    return  # empty clip: don't spin
+        except Exception:
+            log.exception("prefetch failed")
@@ -0,0 +1,62 @@
+"""
+Frame sources: generators of (RGB image, delay_s) pairs.
+
+They decode one frame at a time, so callers can convert or stream clips of
+any length without holding the whole thing in memory.
+"""
+from PIL import Image, ImageSequence
+
+# Browsers treat GIF delays this short as "unspecified"; so do we.
+MIN_GIF_DELAY_S = 0.02
+DEFAULT_GIF_DELAY_S = 0.1
+
+
+def _to_rgb(frame: Image.Image) -> Image.Image:
+    # transparent pixels become black (= LED off)
+    if frame.mode in ("RGBA", "LA", "P", "PA"):
+        frame = frame.convert("RGBA")
+        bg = Image.new("RGBA", frame.size, (0, 0, 0, 255))
+        return Image.alpha_composite(bg, frame).convert("RGB")
+    return frame.convert("RGB")
+
+
+def gif_frames(path):
+    """Frames of an animated GIF (or any multi-frame image) with their own delays."""
+    with Image.open(path) as im:
+        for frame in ImageSequence.Iterator(im):
+            delay = frame.info.get("duration", 0) / 1000.0
+            if delay < MIN_GIF_DELAY_S:
+                delay = DEFAULT_GIF_DELAY_S
+            yield _to_rgb(frame), delay
+
+
+def png_frames(paths, delay_s: float):
+    """A sequence of still images played at a fixed delay."""
+    for p in paths:
+        with Image.open(p) as im:
+            yield _to_rgb(im), delay_s
+
+
+def fitted(frames, size, *, nearest: bool = True):
+    """Resize every frame of a source to the panel size."""
+    resample = Image.NEAREST if nearest else Image.BICUBIC
+    for img, delay in frames:
+        if img.size != tuple(size):
+            img = img.resize(tuple(size), resample=resample)
+        yield img, delay
+
+
+def sprite_frames(path, frame_size, delay_s: float, *, count: int = None):
+    """
+    Frames cut from a sprite sheet, left to right then top to bottom.
+    count limits the number of cells (e.g. when the last row is partial).
+    """
+    fw, fh = frame_size
+    with Image.open(path) as sheet:
+        sheet = _to_rgb(sheet)
+    cols = sheet.width // fw
+    rows = sheet.height // fh
+    total = cols * rows if count is None else min(count, cols * rows)
+    for i in range(total):
+        x, y = (i % cols) * fw, (i // cols) * fh
+        yield sheet.crop((x, y, x + fw, y + fh)), delay_s
@@ -0,0 +1,43 @@
+"""
+Source image -> panel-ready RGB image pipelines.
+
+Each transform takes the opened source image, the target (w, h) and its
+own keyword params, and returns an RGB image of exactly that size. The
+name and params are part of the asset cache key, so changing either
+produces a new cache entry.
+"""
+from PIL import Image
+
+
+def fit(src: Image.Image, size, *, nearest: bool = True) -> Image.Image:
+    """Stretch to size. nearest=True keeps pixel art crisp."""
+    resample = Image.NEAREST if nearest else Image.BICUBIC
+    return src.convert("RGB").resize(size, resample=resample)
+
+
+def alpha_icon(src: Image.Image, size, *, target_h: int = 25) -> Image.Image:
+    """
+    Use the alpha channel as a mask -> white icon on black, scaled up by a
+    whole factor towards target_h and centered on a size-d black frame.
+    """
+    src = src.convert("RGBA")
+    alpha = src.split()[3]
+
+    icon = Image.new("RGB", src.size, (0, 0, 0))
+    white = Image.new("RGB", src.size, (255, 255, 255))
+    icon.paste(white, (0, 0), alpha)
+
+    scale = max(1, target_h // src.size[1])
+    new_w, new_h = src.size[0] * scale, src.size[1] * scale
+    icon = icon.resize((new_w, new_h), Image.NEAREST)
+
+    w, h = size
+    frame = Image.new("RGB", (w, h), (0, 0, 0))
+    frame.paste(icon, ((w - new_w) // 2, (h - new_h) // 2))
+    return frame
+
+
+TRANSFORMS = {
+    "fit": fit,
+    "alpha_icon": alpha_icon,
+}
@@ -0,0 +1,49 @@
+import json
+import platform
+import sys
+import time
+
+FRAME_BUDGET_S = 1.0 / 60.0
+
+
+def percentile(sorted_samples, p: float) -> float:
+    """Nearest-rank percentile of an already sorted list (p in 0..100)."""
+    if not sorted_samples:
+        return 0.0
+    k = max(0, min(len(sorted_samples) - 1, int(round(p / 100.0 * len(sorted_samples))) - 1))
+    return sorted_samples[k]
+
+
+def summarize(samples_s, scale: float = 1.0) -> dict:
+    """p50/p95/p99/mean/max of a list of durations (seconds), reported in ms."""
+    s = sorted(samples_s)
+    ms = 1000.0 * scale
+    return {
+        "p50_ms": percentile(s, 50) * ms,
+        "p95_ms": percentile(s, 95) * ms,
+        "p99_ms": percentile(s, 99) * ms,
+        "mean_ms": (sum(s) / len(s) * ms) if s else 0.0,
+        "max_ms": (s[-1] * ms) if s else 0.0,
+    }
+
+
+def run_meta(**extra) -> dict:
+    meta = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": sys.version.split()[0],
+        "machine": platform.machine(),
+        "platform": platform.platform(),
+    }
+    meta.update(extra)
+    return meta
+
+
+def write_json(path, data):
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def load_json(path):
+    with open(path) as f:
+        return json.load(f)
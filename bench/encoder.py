@@ -0,0 +1,190 @@
+"""
+Encoder decode throughput benchmark (no hardware needed).
+
+Replays a pin trace through KY040Input in both modes and reports how fast
+the decoder runs and whether it decoded every detent and click:
+
+  poll: one poll_once() per 0.5 ms of trace time, reading a TraceGPIO
+  edge: TraceGPIO.play() firing edge callbacks for every pin change
+
+    python -m bench.encoder --detents 2000 --out encoder.json
+    python -m bench.encoder --trace recorded.txt --clk 18 --dt 19 --sw 25
+
+--check instead drives edge mode through FakeGPIO and asserts the decoded
+events: plain detents and clicks, coalescing, and pigpio tick wraps.
+"""
+import argparse
+import queue
+import time
+
+from input.events import KIND_NAMES, LONG_CLICK, ROTATE, SHORT_CLICK
+from input.gpio_fake import FakeGPIO
+from input.gpio_trace import TraceGPIO
+from input.ky040 import KY040Input
+from .common import run_meta, write_json
+
+
+def _drain(q):
+    out = []
+    while True:
+        try:
+            out.append(q.get_nowait())
+        except queue.Empty:
+            return out
+
+
+def _count(events):
+    counts = {"ROTATE": 0, "SHORT_CLICK": 0, "LONG_CLICK": 0}
+    for ev in events:
+        counts[KIND_NAMES[ev.kind]] += abs(ev.delta) if ev.kind == ROTATE else 1
+    return counts
+
+
+def bench_poll(trace, pins, poll_s):
+    now = [0.0]
+    gpio = TraceGPIO(trace, clock=lambda: now[0])
+    q = queue.Queue()
+    enc = KY040Input(gpio, *pins, q, mode="poll")
+    enc.setup()  # no polling thread: we call poll_once() on trace time
+
+    end = trace[-1][0] + 0.01
+    polls = 0
+    t0 = time.perf_counter()
+    while now[0] < end:
+        enc.poll_once(now[0])
+        now[0] += poll_s
+        polls += 1
+    elapsed = time.perf_counter() - t0
+    return {"polls": polls, "seconds": elapsed, "polls_per_s": polls / elapsed,
+            "us_per_poll": 1e6 * elapsed / polls, "decoded": _count(_drain(q))}
+
+
+def bench_edge(trace, pins):
+    gpio = TraceGPIO(trace, clock=lambda: 0.0)
+    q = queue.Queue()
+    enc = KY040Input(gpio, *pins, q, mode="edge")
+    enc.start()
+    t0 = time.perf_counter()
+    edges = gpio.play()
+    elapsed = time.perf_counter() - t0
+    enc.stop()
+    return {"edges": edges, "seconds": elapsed, "edges_per_s": edges / elapsed,
+            "us_per_edge": 1e6 * elapsed / edges if edges else 0.0, "decoded": _count(_drain(q))}
+
+
+def _decoded(events):
+    return [(KIND_NAMES[ev.kind], ev.delta) for ev in events]
+
+
+def check_fake_edge(pins=(18, 19, 25)):
+    """
+    KY040Input(mode="edge") against FakeGPIO, with a fake clock. Raises
+    AssertionError on the first mismatch.
+    """
+    clk, dt, sw = pins
+    now = [1000.0]
+
+    def idle(seconds):
+        now[0] += seconds
+        gpio.advance(int(seconds * 1_000_000))
+
+    # one event per detent, clicks decided on release
+    gpio = FakeGPIO()
+    q = queue.Queue()
+    enc = KY040Input(gpio, *pins, q, mode="edge", clock=lambda: now[0])
+    enc.start()
+    gpio.turn(clk, dt, +3)
+    gpio.turn(clk, dt, -2)
+    gpio.press(sw, hold_s=0.1)
+    gpio.press(sw, hold_s=0.8)
+    events = _drain(q)
+    assert _decoded(events) == [("ROTATE", 1)] * 3 + [("ROTATE", -1)] * 2 + [
+        ("SHORT_CLICK", 0), ("LONG_CLICK", 0)], _decoded(events)
+    assert all(a.t < b.t for a, b in zip(events, events[1:])), "timestamps out of order"
+    short, long_ = events[-2:]
+    assert (short.kind, long_.kind) == (SHORT_CLICK, LONG_CLICK)
+    # both stamped at release: the second press starts 50 ms after the first
+    # release and is held 0.8 s
+    assert abs(long_.t - short.t - 0.85) < 1e-6, long_.t - short.t
+
+    # tick wraps mid-turn: deltas still come out small and positive
+    idle(((0xFFFFFFFF - 5000 - gpio.tick) & 0xFFFFFFFF) / 1_000_000)
+    gpio.turn(clk, dt, +2)
+    events = _drain(q)
+    assert _decoded(events) == [("ROTATE", 1)] * 2, _decoded(events)
+    assert 0 < events[1].t - events[0].t < 0.1, events[1].t - events[0].t
+
+    # idle for more than one full wrap (~71.6 min): times re-anchor on the clock
+    idle(72 * 60)
+    gpio.turn(clk, dt, +1)
+    gpio.press(sw, hold_s=0.1)
+    events = _drain(q)
+    assert _decoded(events) == [("ROTATE", 1), ("SHORT_CLICK", 0)], _decoded(events)
+    assert abs(events[0].t - now[0]) < 1.0, (events[0].t, now[0])
+    enc.stop()
+
+    # coalescing: first detent goes out at once, the rest of the spin merges
+    # (the flush timer runs on real time, so give it a moment)
+    coalesce_s = 0.05
+    gpio = FakeGPIO()
+    q = queue.Queue()
+    enc = KY040Input(gpio, *pins, q, mode="edge", coalesce_s=coalesce_s, clock=lambda: now[0])
+    enc.start()
+    gpio.turn(clk, dt, +5, step_us=1000)
+    time.sleep(4 * coalesce_s)
+    assert _decoded(_drain(q)) == [("ROTATE", 1), ("ROTATE", 4)]
+
+    idle(1.0)
+    gpio.turn(clk, dt, -3, step_us=1000)
+    gpio.press(sw, hold_s=0.1)  # release flushes what's pending first
+    assert _decoded(_drain(q)) == [("ROTATE", -1), ("ROTATE", -2), ("SHORT_CLICK", 0)]
+
+    # a long idle in between must not strand detents behind the window
+    idle(72 * 60)
+    gpio.turn(clk, dt, +3, step_us=1000)
+    time.sleep(4 * coalesce_s)
+    assert _decoded(_drain(q)) == [("ROTATE", 1), ("ROTATE", 2)]
+    enc.stop()
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--trace", help="recorded trace file (see TraceGPIO.save); default: synthetic")
+    ap.add_argument("--clk", type=int, default=18)
+    ap.add_argument("--dt", type=int, default=19)
+    ap.add_argument("--sw", type=int, default=25)
+    ap.add_argument("--detents", type=int, default=1000, help="synthetic: detents each way")
+    ap.add_argument("--poll-s", type=float, default=0.0005)
+    ap.add_argument("--out", help="write results JSON here")
+    ap.add_argument("--check", action="store_true", help="run the FakeGPIO edge-mode check and exit")
+    args = ap.parse_args(argv)
+
+    if args.check:
+        check_fake_edge((args.clk, args.dt, args.sw))
+        print("edge check OK")
+        return
+
+    pins = (args.clk, args.dt, args.sw)
+    if args.trace:
+        trace = TraceGPIO.load(args.trace).trace
+        expected = None
+    else:
+        # step_s > rot_debounce_s, and slow enough for poll_s to see every step
+        moves = [("turn", args.detents), ("wait", 0.1), ("turn", -args.detents),
+                 ("press", 0.1), ("wait", 0.1), ("press", 0.8)]
+        trace = TraceGPIO.synthetic(*pins, moves, step_s=max(0.002, 2 * args.poll_s))
+        expected = {"ROTATE": 2 * args.detents, "SHORT_CLICK": 1, "LONG_CLICK": 1}
+
+    results = {"poll": bench_poll(trace, pins, args.poll_s), "edge": bench_edge(trace, pins)}
+    for mode, r in results.items():
+        rate = r.get("polls_per_s") or r.get("edges_per_s")
+        ok = "" if expected is None else ("  OK" if r["decoded"] == expected else f"  MISMATCH (expected {expected})")
+        print(f"{mode:<5} {rate:12.0f}/s  decoded {r['decoded']}{ok}")
+
+    if args.out:
+        write_json(args.out, {"meta": run_meta(trace=args.trace, snapshots=len(trace), poll_s=args.poll_s),
+                              "expected": expected, "modes": results})
+
+
+if __name__ == "__main__":
+    main()
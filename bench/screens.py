@@ -0,0 +1,248 @@
+"""
+Per-screen render benchmark.
+
+Runs each screen for N simulated seconds at a fixed dt on the headless
+backend, feeding scripted input events, and reports per-phase frame-time
+percentiles, allocations per frame and FPS as JSON.
+
+Allocations come from tracemalloc snapshots around each frame: the number
+of memory blocks allocated during the frame and still alive at its end
+(temporaries freed within the frame don't show up), plus peak and net
+bytes.
+
+    python -m bench.screens --font /path/to/5x7.bdf --seconds 10 --out bench.json
+    python -m bench.screens --font ... --baseline bench.json   # compare runs
+
+--slowdown scales host timings to the target board (measure the ratio once
+by running the same bench on the Pi); "holds_60fps" is judged on the
+scaled p99 frame time.
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+from pathlib import Path
+
+from display import create_display
+from timing import time_service
+from input.events import Event, ROTATE, SHORT_CLICK, LONG_CLICK
+from .common import FRAME_BUDGET_S, load_json, run_meta, summarize, write_json
+
+PHASES = ("handle", "update", "draw", "swap")
+REPO_DIR = Path(__file__).resolve().parent.parent
+
+
+_KINDS = {"ROTATE": ROTATE, "SHORT_CLICK": SHORT_CLICK, "LONG_CLICK": LONG_CLICK}
+
+# the bench's own bookkeeping isn't the screen's allocation
+_ALLOC_IGNORE = (tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__))
+
+
+def _new_blocks(before, after) -> int:
+    """Blocks allocated between two snapshots and still alive (stat.count_diff, summed)."""
+    diff = after.filter_traces(_ALLOC_IGNORE).compare_to(before.filter_traces(_ALLOC_IGNORE), "lineno")
+    return sum(stat.count_diff for stat in diff if stat.count_diff > 0)
+
+
+def _ev(kind, delta=0):
+    return Event(_KINDS[kind], delta)
+
+
+# screen name -> (factory(), period_s, [(t_seconds, event), ...]).
+# Scripts repeat every `period` seconds so any --seconds value exercises them.
+def _scenarios(font, images_dir):
+    images_dir = Path(images_dir)
+    from screens import ClockScreen, TextScreen, ImageScreen, CountdownScreen, StopwatchScreen
+
+    return {
+        "Clock": (lambda: ClockScreen(font), 10.0, []),
+        "Text": (lambda: TextScreen(font, "Salaam!"), 10.0, [
+            (1.0, _ev("SHORT_CLICK")),
+            (2.0, _ev("SHORT_CLICK")),
+            (5.0, _ev("LONG_CLICK")),
+        ]),
+        "Marquee": (lambda: TextScreen(font, ["Status: all systems nominal, next bus in 7 min"] * 20), 10.0, [
+            (3.0, _ev("SHORT_CLICK")),            # recolor: rebuilds the strip
+        ]),
+        "Image": (lambda: ImageScreen([str(images_dir / "house.png")] * 3), 10.0, [
+            (0.5, _ev("SHORT_CLICK")),            # enter edit mode
+            (1.0, _ev("ROTATE", delta=1)),
+            (1.5, _ev("ROTATE", delta=1)),
+            (2.0, _ev("LONG_CLICK")),             # invert on
+            (3.0, _ev("ROTATE", delta=-1)),
+            (6.0, _ev("LONG_CLICK")),             # invert off
+            (6.5, _ev("SHORT_CLICK")),            # leave edit mode
+        ]),
+        "Countdown": (lambda: CountdownScreen(font), 10.0, []),
+        "Stopwatch": (lambda: StopwatchScreen(font, images_dir, width=25, height=25, anim_fps=2.0), 10.0, [
+            (2.0, _ev("SHORT_CLICK")),            # idle -> running
+            (6.0, _ev("SHORT_CLICK")),            # pause
+            (7.0, _ev("SHORT_CLICK")),            # resume
+            (9.0, _ev("LONG_CLICK")),             # back to idle animation
+        ]),
+    }
+
+
+def _events_by_frame(script, period, seconds, dt):
+    """Expand a repeating script into {frame_index: [events]}."""
+    out = {}
+    start = 0.0
+    while start < seconds:
+        for t, ev in script:
+            if start + t < seconds:
+                out.setdefault(int((start + t) / dt), []).append(ev)
+        start += period
+    return out
+
+
+def _run(screen, display, events, frames, dt, *, lazy, trace_alloc):
+    canvas = display.create_canvas()
+    times = {p: [] for p in PHASES}
+    frame_times = []
+    alloc_peak = []
+    alloc_net = []
+    alloc_blocks = []
+    drawn = 0
+    clock = time.perf_counter
+
+    # run the shared time service on simulated time too, so second
+    # boundaries come every 1/dt frames like they would on the panel
+    sim_now = [time.time()]
+    real_clock, time_service.clock = time_service.clock, lambda: sim_now[0]
+
+    screen.on_enter()
+    screen.invalidate()
+    gc.collect()
+
+    for i in range(frames):
+        if trace_alloc:
+            snap0 = tracemalloc.take_snapshot()  # before mem0, so its own memory isn't counted
+            tracemalloc.reset_peak()
+            mem0 = tracemalloc.get_traced_memory()[0]
+
+        t0 = clock()
+        for ev in events.get(i, ()):
+            screen.handle(ev)
+        t1 = clock()
+        sim_now[0] += dt
+        time_service.tick()
+        screen.update(dt)
+        t2 = clock()
+        draw = screen.dirty or not lazy
+        if draw:
+            screen.dirty = False
+            screen.draw(canvas)
+        t3 = clock()
+        if draw:
+            canvas = display.swap(canvas)
+            drawn += 1
+        t4 = clock()
+
+        if trace_alloc:
+            cur, peak = tracemalloc.get_traced_memory()
+            alloc_peak.append(peak - mem0)
+            alloc_net.append(cur - mem0)
+            alloc_blocks.append(_new_blocks(snap0, tracemalloc.take_snapshot()))
+        else:
+            times["handle"].append(t1 - t0)
+            times["update"].append(t2 - t1)
+            times["draw"].append(t3 - t2)
+            times["swap"].append(t4 - t3)
+            frame_times.append(t4 - t0)
+
+    screen.on_exit()
+    screen.close()
+    time_service.clock = real_clock
+    return times, frame_times, (alloc_blocks, alloc_peak, alloc_net), drawn
+
+
+def bench_screen(factory, period, script, *, display, seconds, dt, lazy, slowdown):
+    frames = max(1, int(round(seconds / dt)))
+    events = _events_by_frame(script, period, seconds, dt)
+
+    # timing pass (tracemalloc off: it slows every allocation down)
+    times, frame_times, _, drawn = _run(factory(), display, events, frames, dt,
+                                        lazy=lazy, trace_alloc=False)
+
+    # allocation pass on a fresh instance so both passes see the same script
+    tracemalloc.start()
+    try:
+        _, _, (alloc_blocks, alloc_peak, alloc_net), _ = _run(factory(), display, events, frames, dt,
+                                                              lazy=lazy, trace_alloc=True)
+    finally:
+        tracemalloc.stop()
+
+    total = sum(frame_times)
+    frame = summarize(frame_times, slowdown)
+    peak_sorted = sorted(alloc_peak)
+    blocks_sorted = sorted(alloc_blocks)
+    return {
+        "frames": frames,
+        "drawn_frames": drawn,
+        "phases": {p: summarize(times[p], slowdown) for p in PHASES},
+        "frame": frame,
+        "fps": (frames / (total * slowdown)) if total > 0 else float("inf"),
+        "alloc": {
+            "allocs_per_frame": (sum(alloc_blocks) / len(alloc_blocks)) if alloc_blocks else 0.0,
+            "allocs_p50": blocks_sorted[len(blocks_sorted) // 2] if blocks_sorted else 0,
+            "allocs_max": blocks_sorted[-1] if blocks_sorted else 0,
+            "peak_bytes_p50": peak_sorted[len(peak_sorted) // 2] if peak_sorted else 0,
+            "peak_bytes_max": peak_sorted[-1] if peak_sorted else 0,
+            "net_bytes_per_frame": (sum(alloc_net) / len(alloc_net)) if alloc_net else 0.0,
+        },
+        "holds_60fps": frame["p99_ms"] <= FRAME_BUDGET_S * 1000.0,
+    }
+
+
+def _print_report(results, baseline=None):
+    base = (baseline or {}).get("screens", {})
+    print(f"{'screen':<11} {'p50':>8} {'p95':>8} {'p99':>8} {'fps':>10} {'allocs':>7} {'peak B':>8}  60fps")
+    for name, r in results.items():
+        f = r["frame"]
+        line = (f"{name:<11} {f['p50_ms']:8.3f} {f['p95_ms']:8.3f} {f['p99_ms']:8.3f} "
+                f"{r['fps']:10.0f} {r['alloc']['allocs_per_frame']:7.1f} {r['alloc']['peak_bytes_p50']:8d}  {'yes' if r['holds_60fps'] else 'NO'}")
+        if name in base:
+            old = base[name]["frame"]["p99_ms"]
+            if old > 0:
+                line += f"   p99 {100.0 * (f['p99_ms'] - old) / old:+.1f}% vs baseline"
+        print(line)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--font", required=True, help="BDF font path (e.g. rpi-rgb-led-matrix/fonts/5x7.bdf)")
+    ap.add_argument("--images", default=str(REPO_DIR / "images"), help="images directory")
+    ap.add_argument("--seconds", type=float, default=10.0, help="simulated seconds per screen")
+    ap.add_argument("--dt", type=float, default=1.0 / 60.0, help="fixed frame step in seconds")
+    ap.add_argument("--cols", type=int, default=64)
+    ap.add_argument("--rows", type=int, default=32)
+    ap.add_argument("--screen", action="append", help="only run these screens (repeatable)")
+    ap.add_argument("--lazy", action="store_true", help="honour the dirty flag instead of drawing every frame")
+    ap.add_argument("--slowdown", type=float, default=1.0, help="multiply host timings by this factor")
+    ap.add_argument("--out", help="write results JSON here")
+    ap.add_argument("--baseline", help="previous results JSON to compare against")
+    args = ap.parse_args(argv)
+
+    display = create_display("headless", cols=args.cols, rows=args.rows)
+    scenarios = _scenarios(args.font, args.images)
+    names = args.screen or list(scenarios)
+
+    results = {}
+    for name in names:
+        factory, period, script = scenarios[name]
+        results[name] = bench_screen(factory, period, script, display=display,
+                                     seconds=args.seconds, dt=args.dt,
+                                     lazy=args.lazy, slowdown=args.slowdown)
+
+    _print_report(results, load_json(args.baseline) if args.baseline else None)
+
+    if args.out:
+        write_json(args.out, {
+            "meta": run_meta(seconds=args.seconds, dt=args.dt, cols=args.cols, rows=args.rows,
+                             lazy=args.lazy, slowdown=args.slowdown),
+            "screens": results,
+        })
+
+
+if __name__ == "__main__":
+    main()
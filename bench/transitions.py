@@ -0,0 +1,96 @@
+"""
+Screen transition benchmark (headless, no hardware needed).
+
+Runs every transition through ScreenManager.render() on a simulated clock
+and reports per-frame render times against the 60 FPS budget. The incoming
+screen redraws every frame (worst case: an animation sliding in).
+
+    python -m bench.transitions --size 64x32 --size 128x64 --out transitions.json
+
+--push pil times the rgbmatrix path, where each blended frame becomes a
+PIL image before SetImage, instead of handing the array straight over.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from display import ArrayCanvas
+from manager import ScreenManager, TRANSITIONS
+from screens.base import Screen
+from .common import FRAME_BUDGET_S, run_meta, summarize, write_json
+
+
+class _Pattern(Screen):
+    """Full-panel image that changes every frame."""
+
+    name = "Pattern"
+
+    def __init__(self, w, h, seed):
+        rng = np.random.default_rng(seed)
+        self.frames = [rng.integers(0, 256, (h, w, 3), dtype=np.uint8) for _ in range(8)]
+        self.i = 0
+
+    def draw(self, canvas):
+        canvas.SetImage(self.frames[self.i], 0, 0)
+        self.i = (self.i + 1) % len(self.frames)
+        self.invalidate()
+
+
+class _PilCanvas(ArrayCanvas):
+    """Takes PIL images only, like a FrameCanvas, so render() converts."""
+
+    def SetImage(self, image, offset_x=0, offset_y=0, unsafe=True):
+        super().SetImage(np.asarray(image), offset_x, offset_y)
+
+
+def bench_transition(name, size, *, duration, switches, dt, push):
+    w, h = size
+    now = [0.0]
+    mgr = ScreenManager([_Pattern(w, h, 1), _Pattern(w, h, 2)], prewarm=False,
+                        transition=TRANSITIONS[name](duration), clock=lambda: now[0])
+    canvas = (ArrayCanvas if push == "array" else _PilCanvas)(w, h)
+    mgr.render(canvas)  # learn the canvas size
+
+    samples = []
+    for _ in range(switches):
+        mgr.next()
+        while mgr.in_transition:
+            t0 = time.perf_counter()
+            mgr.render(canvas)
+            samples.append(time.perf_counter() - t0)
+            now[0] += dt
+    frame = summarize(samples)
+    return {"frames": len(samples), "frame": frame,
+            "holds_60fps": frame["p99_ms"] <= FRAME_BUDGET_S * 1000.0}
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--size", action="append", help="WxH (repeatable), default 64x32 and 128x64")
+    ap.add_argument("--duration", type=float, default=0.3, help="transition length in seconds")
+    ap.add_argument("--switches", type=int, default=50, help="transitions per measurement")
+    ap.add_argument("--dt", type=float, default=1.0 / 60.0)
+    ap.add_argument("--push", choices=("array", "pil"), default="array")
+    ap.add_argument("--out", help="write results JSON here")
+    args = ap.parse_args(argv)
+
+    sizes = [tuple(int(v) for v in s.lower().split("x")) for s in (args.size or ["64x32", "128x64"])]
+    results = {}
+    print(f"{'size':<8} {'transition':<10} {'p50':>8} {'p99':>8} {'max':>8}  60fps")
+    for w, h in sizes:
+        for name in TRANSITIONS:
+            r = bench_transition(name, (w, h), duration=args.duration, switches=args.switches,
+                                 dt=args.dt, push=args.push)
+            results[f"{w}x{h}/{name}"] = r
+            f = r["frame"]
+            print(f"{f'{w}x{h}':<8} {name:<10} {f['p50_ms']:8.3f} {f['p99_ms']:8.3f} {f['max_ms']:8.3f}  "
+                  f"{'yes' if r['holds_60fps'] else 'NO'}")
+
+    if args.out:
+        write_json(args.out, {"meta": run_meta(duration=args.duration, dt=args.dt, push=args.push),
+                              "transitions": results})
+
+
+if __name__ == "__main__":
+    main()
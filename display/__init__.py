@@ -1 +1,37 @@
-from .matrix import MatrixDisplay
+from . import graphics
+from .bdf import BdfFont
+from .canvas import ArrayCanvas
+from .diff import DiffPusher
+from .fonts import FontRegistry, fonts, get_font
+from .headless import HeadlessDisplay
+from .pipeline import RenderPipeline
+from .textcache import TextCache, draw_text, text_cache
+from .viewport import Viewport, viewport
+
+BACKENDS = ("rgbmatrix", "headless")
+
+
+def create_display(backend: str = "rgbmatrix", **opts):
+    """
+    Build the display for `backend` and point `display.graphics` at the
+    matching implementation. Call this before constructing any screens.
+    """
+    if backend == "rgbmatrix":
+        from rgbmatrix import graphics as impl
+        from .matrix import MatrixDisplay as display_cls
+    elif backend == "headless":
+        from . import softgraphics as impl
+        display_cls = HeadlessDisplay
+    else:
+        raise ValueError(f"Unknown display backend {backend!r}; expected one of {BACKENDS}")
+
+    graphics.use(impl)
+    return display_cls(**opts)
+
+
+def __getattr__(name):
+    # MatrixDisplay needs the rgbmatrix bindings; only import them on demand
+    if name == "MatrixDisplay":
+        from .matrix import MatrixDisplay
+        return MatrixDisplay
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
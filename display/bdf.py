@@ -0,0 +1,112 @@
+import numpy as np
+
+REPLACEMENT_CHAR = 0xFFFD
+
+
+class Glyph:
+    __slots__ = ("width", "height", "x_offset", "y_offset", "dwidth", "mask")
+
+    def __init__(self, width, height, x_offset, y_offset, dwidth, mask):
+        self.width = width
+        self.height = height
+        self.x_offset = x_offset
+        self.y_offset = y_offset
+        self.dwidth = dwidth    # advance to the next glyph
+        self.mask = mask        # (height, width) bool array, True = lit
+
+
+class BdfFont:
+    """
+    Minimal BDF font reader with the rgbmatrix `graphics.Font` interface
+    (LoadFont / CharacterWidth / height / baseline), plus per-glyph bitmaps
+    as NumPy masks so text can be rasterized without the C++ library.
+
+    Glyph placement follows rpi-rgb-led-matrix: the glyph's bottom row sits
+    `y_offset` above the baseline and its x offset is ignored.
+    """
+
+    def __init__(self):
+        self.path = None
+        self.height = 0
+        self.baseline = 0
+        self.glyphs = {}
+
+    @classmethod
+    def load(cls, path) -> "BdfFont":
+        font = cls()
+        font.LoadFont(path)
+        return font
+
+    def LoadFont(self, path):
+        self.path = str(path)
+        glyphs = {}
+        encoding = None
+        dwidth = 0
+        bbx = (0, 0, 0, 0)
+        rows = None
+
+        with open(path, "r", encoding="latin-1") as f:
+            for raw in f:
+                line = raw.strip()
+
+                if rows is not None:
+                    if line == "ENDCHAR":
+                        if encoding is not None and encoding >= 0:
+                            glyphs[encoding] = self._make_glyph(bbx, dwidth, rows)
+                        rows = None
+                    else:
+                        rows.append(line)
+                    continue
+
+                key, _, rest = line.partition(" ")
+                if key == "FONTBOUNDINGBOX":
+                    _, h, _, y_off = (int(v) for v in rest.split())
+                    self.height = h
+                    self.baseline = h + y_off
+                elif key == "STARTCHAR":
+                    encoding, dwidth, bbx = None, 0, (0, 0, 0, 0)
+                elif key == "ENCODING":
+                    encoding = int(rest.split()[0])
+                elif key == "DWIDTH":
+                    dwidth = int(rest.split()[0])
+                elif key == "BBX":
+                    bbx = tuple(int(v) for v in rest.split())
+                elif key == "BITMAP":
+                    rows = []
+
+        if not glyphs:
+            raise ValueError(f"No glyphs found in BDF font: {path}")
+        self.glyphs = glyphs
+
+    @staticmethod
+    def _make_glyph(bbx, dwidth, rows) -> Glyph:
+        w, h, x_off, y_off = bbx
+        rows = rows[:h]
+        row_bytes = (w + 7) // 8
+        mask = np.zeros((h, w), dtype=bool)
+        if rows and all(len(r) == 2 * row_bytes for r in rows):
+            # each row is the glyph width padded to whole bytes, MSB first
+            packed = np.frombuffer(bytes.fromhex("".join(rows)), dtype=np.uint8)
+            bits = np.unpackbits(packed.reshape(len(rows), row_bytes), axis=1)
+            mask[:len(rows)] = bits[:, :w].astype(bool)
+        else:
+            # sloppy font: rows of uneven length
+            for y, hexrow in enumerate(rows):
+                if not hexrow:
+                    continue
+                value = int(hexrow, 16)
+                nbits = len(hexrow) * 4
+                for x in range(min(w, nbits)):
+                    if (value >> (nbits - 1 - x)) & 1:
+                        mask[y, x] = True
+        return Glyph(w, h, x_off, y_off, dwidth, mask)
+
+    def glyph(self, codepoint: int):
+        g = self.glyphs.get(codepoint)
+        if g is None:
+            g = self.glyphs.get(REPLACEMENT_CHAR)
+        return g
+
+    def CharacterWidth(self, codepoint: int) -> int:
+        g = self.glyph(codepoint)
+        return g.dwidth if g is not None else -1
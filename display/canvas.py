@@ -0,0 +1,54 @@
+import numpy as np
+
+
+class ArrayCanvas:
+    """
+    Software canvas with the same drawing API as an rgbmatrix FrameCanvas
+    (Clear / Fill / SetPixel / SetImage), backed by a (rows, cols, 3) uint8
+    NumPy array in `self.array`.
+    """
+
+    def __init__(self, width: int, height: int, array=None):
+        self.width = width
+        self.height = height
+        # `array` lets a canvas draw straight into part of a bigger one
+        self.array = np.zeros((height, width, 3), dtype=np.uint8) if array is None else array
+
+    def region(self, x: int, y: int, width: int, height: int) -> "ArrayCanvas":
+        """A canvas over (x, y, width, height) of this one, sharing its pixels."""
+        x1 = min(self.width, x + width)
+        y1 = min(self.height, y + height)
+        x, y = max(0, x), max(0, y)
+        return ArrayCanvas(max(0, x1 - x), max(0, y1 - y), self.array[y:y1, x:x1])
+
+    def Clear(self):
+        self.array.fill(0)
+
+    def Fill(self, red, green, blue):
+        self.array[:, :] = (red, green, blue)
+
+    def SetPixel(self, x, y, red, green, blue):
+        # off-canvas writes are ignored, same as the C++ canvas
+        if 0 <= x < self.width and 0 <= y < self.height:
+            self.array[y, x] = (red, green, blue)
+
+    def SetImage(self, image, offset_x=0, offset_y=0, unsafe=True):
+        """
+        Copy a PIL RGB image (or an (h, w, 3) uint8 array) onto the canvas,
+        clipped to the canvas bounds. `unsafe` is accepted for API parity.
+        """
+        if isinstance(image, np.ndarray):
+            src = image
+        else:
+            if image.mode != "RGB":
+                raise ValueError("Only RGB mode is supported for SetImage(); convert with image.convert('RGB').")
+            src = np.asarray(image)
+
+        h, w = src.shape[:2]
+        x0 = max(0, offset_x)
+        y0 = max(0, offset_y)
+        x1 = min(self.width, offset_x + w)
+        y1 = min(self.height, offset_y + h)
+        if x0 >= x1 or y0 >= y1:
+            return
+        self.array[y0:y1, x0:x1] = src[y0 - offset_y:y1 - offset_y, x0 - offset_x:x1 - offset_x, :3]
@@ -0,0 +1,170 @@
+import time
+
+import numpy as np
+from PIL import Image
+
+from .canvas import ArrayCanvas
+
+
+class DiffPusher:
+    """
+    Copies a rendered frame onto a panel canvas, writing only what changed.
+
+    `shadow` is what the target canvas held before (None = unknown). The
+    changed pixels are found with one vectorized compare, grouped into
+    bounding boxes (runs of changed rows, at most merge_gap unchanged rows
+    apart), and each box is written with whichever is cheaper:
+
+      SetPixel per changed pixel:  changed * pixel_cost
+      SetImage of the box:         image_overhead + area * image_cost
+
+    If the boxes together would cost more than one full SetImage, the whole
+    frame is pushed instead. Costs are relative to one SetPixel call;
+    calibrate() measures them on a real canvas.
+
+    forget() makes every shadow seen so far count as unknown, for when the
+    panel's pixels changed behind our back (e.g. a brightness change).
+    """
+
+    def __init__(self, *, pixel_cost=1.0, image_cost=0.02, image_overhead=40.0, merge_gap=2):
+        self.pixel_cost = pixel_cost
+        self.image_cost = image_cost
+        self.image_overhead = image_overhead
+        self.merge_gap = merge_gap
+        self._known = set()  # id()s of shadows that match their canvas
+        self.reset_stats()
+
+    def forget(self):
+        self._known.clear()
+
+    def reset_stats(self):
+        self.frames = 0
+        self.unchanged = 0        # frames with nothing to write
+        self.full = 0             # full-frame SetImage pushes
+        self.box_images = 0       # boxes written with SetImage
+        self.box_pixels = 0       # boxes written with SetPixel
+        self.pixels_total = 0     # pixels a full push every frame would write
+        self.pixels_changed = 0
+        self.pixels_written = 0
+
+    def _set_image(self, canvas, arr, x, y):
+        if isinstance(canvas, ArrayCanvas):
+            canvas.SetImage(arr, x, y)
+        else:
+            canvas.SetImage(Image.fromarray(np.ascontiguousarray(arr)), x, y)
+
+    def _boxes(self, changed):
+        ys = np.flatnonzero(changed.any(axis=1))
+        if not len(ys):
+            return []
+        cut = np.flatnonzero(np.diff(ys) > self.merge_gap + 1)
+        starts = ys[np.r_[0, cut + 1]]
+        ends = ys[np.r_[cut, len(ys) - 1]] + 1
+        boxes = []
+        for y0, y1 in zip(starts.tolist(), ends.tolist()):
+            xs = np.flatnonzero(changed[y0:y1].any(axis=0))
+            x0, x1 = int(xs[0]), int(xs[-1]) + 1
+            boxes.append((x0, y0, x1, y1, int(np.count_nonzero(changed[y0:y1, x0:x1]))))
+        return boxes
+
+    def push(self, frame, canvas, shadow=None):
+        """
+        Make `canvas` show `frame` ((h, w, 3) uint8). Returns the new shadow
+        (`shadow` updated in place, or a fresh copy of frame).
+        """
+        h, w = frame.shape[:2]
+        self.frames += 1
+        self.pixels_total += w * h
+
+        if shadow is None or shadow.shape != frame.shape or id(shadow) not in self._known:
+            self._set_image(canvas, frame, 0, 0)
+            self.full += 1
+            self.pixels_changed += w * h
+            self.pixels_written += w * h
+            if shadow is None or shadow.shape != frame.shape:
+                shadow = frame.copy()
+            else:
+                np.copyto(shadow, frame)
+            self._known.add(id(shadow))
+            return shadow
+
+        changed = (frame != shadow).any(axis=2)
+        boxes = self._boxes(changed)
+        if not boxes:
+            self.unchanged += 1
+            return shadow
+
+        plan = []
+        cost = 0.0
+        for x0, y0, x1, y1, n in boxes:
+            by_pixel = n * self.pixel_cost
+            by_image = self.image_overhead + (x1 - x0) * (y1 - y0) * self.image_cost
+            plan.append((by_pixel <= by_image, x0, y0, x1, y1, n))
+            cost += min(by_pixel, by_image)
+        self.pixels_changed += sum(b[4] for b in boxes)
+
+        if cost >= self.image_overhead + w * h * self.image_cost:
+            self._set_image(canvas, frame, 0, 0)
+            self.full += 1
+            self.pixels_written += w * h
+        else:
+            for per_pixel, x0, y0, x1, y1, n in plan:
+                if per_pixel:
+                    yy, xx = np.nonzero(changed[y0:y1, x0:x1])
+                    rgb = frame[y0:y1, x0:x1][yy, xx].tolist()
+                    for x, y, (r, g, b) in zip((xx + x0).tolist(), (yy + y0).tolist(), rgb):
+                        canvas.SetPixel(x, y, r, g, b)
+                    self.box_pixels += 1
+                    self.pixels_written += n
+                else:
+                    self._set_image(canvas, frame[y0:y1, x0:x1], x0, y0)
+                    self.box_images += 1
+                    self.pixels_written += (x1 - x0) * (y1 - y0)
+
+        np.copyto(shadow, frame)
+        return shadow
+
+    def calibrate(self, canvas, rounds: int = 200):
+        """Measure SetPixel / SetImage costs on `canvas` (clobbers it)."""
+        w, h = canvas.width, canvas.height
+        full = np.zeros((h, w, 3), dtype=np.uint8)
+
+        t0 = time.perf_counter()
+        for i in range(rounds):
+            canvas.SetPixel(i % w, 0, 1, 2, 3)
+        t_px = (time.perf_counter() - t0) / rounds
+
+        t0 = time.perf_counter()
+        for _ in range(rounds):
+            self._set_image(canvas, full[:1, :1], 0, 0)
+        t_small = (time.perf_counter() - t0) / rounds
+
+        t0 = time.perf_counter()
+        for _ in range(max(1, rounds // 10)):
+            self._set_image(canvas, full, 0, 0)
+        t_full = (time.perf_counter() - t0) / max(1, rounds // 10)
+
+        self.pixel_cost = 1.0
+        self.image_overhead = t_small / t_px
+        self.image_cost = max(0.0, t_full - t_small) / (w * h) / t_px
+        return self
+
+    def stats(self) -> dict:
+        total = self.pixels_total or 1
+        return {
+            "frames": self.frames,
+            "unchanged": self.unchanged,
+            "full": self.full,
+            "box_images": self.box_images,
+            "box_pixels": self.box_pixels,
+            "pixels_changed": self.pixels_changed,
+            "pixels_written": self.pixels_written,
+            "saved": 1.0 - self.pixels_written / total,
+        }
+
+    def report(self) -> str:
+        s = self.stats()
+        return (f"partial updates: {s['frames']} frames, {s['unchanged']} unchanged, {s['full']} full, "
+                f"{s['box_images']} box/SetImage, {s['box_pixels']} box/SetPixel; "
+                f"wrote {s['pixels_written']} px for {s['pixels_changed']} changed "
+                f"({100.0 * s['saved']:.1f}% less than full pushes)")
@@ -0,0 +1,51 @@
+import os
+import threading
+import time
+
+from .bdf import BdfFont
+
+
+class FontRegistry:
+    """
+    Process-wide font cache: each BDF file is parsed once and the same
+    BdfFont object is handed to every screen that asks for it (which also
+    lets the text cache share glyphs between screens).
+    """
+
+    def __init__(self):
+        self._fonts = {}
+        self._lock = threading.Lock()
+        self.load_times = {}  # abs path -> seconds spent parsing
+
+    def get(self, path) -> BdfFont:
+        key = os.path.abspath(os.fspath(path))
+        font = self._fonts.get(key)
+        if font is not None:
+            return font
+
+        with self._lock:
+            font = self._fonts.get(key)  # another thread may have won the race
+            if font is None:
+                t0 = time.perf_counter()
+                font = BdfFont.load(key)
+                self.load_times[key] = time.perf_counter() - t0
+                self._fonts[key] = font
+        return font
+
+    def prewarm(self, *paths):
+        """Load fonts up front (e.g. at boot) so no screen pays for it later."""
+        for p in paths:
+            self.get(p)
+
+    def report(self) -> str:
+        lines = [f"{t * 1000.0:7.1f} ms  {path}" for path, t in self.load_times.items()]
+        total = sum(self.load_times.values()) * 1000.0
+        lines.append(f"{total:7.1f} ms  total ({len(self.load_times)} fonts)")
+        return "\n".join(lines)
+
+
+fonts = FontRegistry()
+
+
+def get_font(path) -> BdfFont:
+    return fonts.get(path)
@@ -0,0 +1,23 @@
+"""
+Backend-neutral `graphics` module.
+
+Screens do `from display import graphics` and use it exactly like
+`rgbmatrix.graphics`. create_display() rebinds the names below to the
+selected backend, so lookups stay plain module attributes (no per-call
+dispatch).
+"""
+try:
+    from rgbmatrix import graphics as _default
+except ImportError:  # not on a Pi
+    from . import softgraphics as _default
+
+NAMES = ("Color", "Font", "DrawText", "DrawLine", "DrawCircle")
+
+
+def use(impl):
+    g = globals()
+    for name in NAMES:
+        g[name] = getattr(impl, name)
+
+
+use(_default)
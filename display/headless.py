@@ -0,0 +1,38 @@
+from .canvas import ArrayCanvas
+
+
+class HeadlessDisplay:
+    """
+    Drop-in MatrixDisplay replacement that renders into NumPy framebuffers.
+    No hardware, no vsync wait: swap() just flips buffers and returns.
+
+    The panel-only options (gpio_mapping, panel_type, ...) are accepted and
+    ignored so both backends can be built from the same config.
+    """
+
+    def __init__(
+        self,
+        *,
+        cols=64,
+        rows=32,
+        chain_length=1,
+        parallel=1,
+        brightness=60,
+        **_panel_opts,
+    ):
+        self.width = cols * chain_length
+        self.height = rows * parallel
+        self.brightness = brightness
+        self.frames = 0  # number of swaps so far
+
+        # what the "panel" is currently showing
+        self.front = ArrayCanvas(self.width, self.height)
+
+    def create_canvas(self):
+        return ArrayCanvas(self.width, self.height)
+
+    def swap(self, canvas):
+        # same contract as SwapOnVSync: show `canvas`, hand back the old one
+        prev, self.front = self.front, canvas
+        self.frames += 1
+        return prev
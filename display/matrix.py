@@ -37,6 +37,18 @@ class MatrixDisplay:
             opts.pwm_lsb_nanoseconds = pwm_lsb_nanoseconds
 
         self.matrix = RGBMatrix(options=opts)
+        # whole chain: cols * chain_length x rows * parallel
+        self.width = self.matrix.width
+        self.height = self.matrix.height
+
+    @property
+    def brightness(self) -> int:
+        return self.matrix.brightness
+
+    @brightness.setter
+    def brightness(self, value: int):
+        # only applies to pixels drawn from now on: redraw after changing it
+        self.matrix.brightness = value
 
     def create_canvas(self):
         return self.matrix.CreateFrameCanvas()
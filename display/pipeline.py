@@ -0,0 +1,153 @@
+import collections
+import queue
+import threading
+import time
+
+from .canvas import ArrayCanvas
+
+
+class RenderPipeline:
+    """
+    Hands finished frames to the panel, optionally overlapping drawing the
+    next frame with the vsync wait of the current one.
+
+    display.swap() (SwapOnVSync on the panel) blocks until the next refresh.
+    By default submit() does that swap right there, like the main loop
+    always did. With threaded=True a "display-swap" thread waits instead,
+    using three canvases: the one on the panel, one queued for vsync and
+    one the main loop draws into. The main loop only blocks when it gets
+    more than one frame ahead of the panel. That only pays off if
+    SwapOnVSync releases the GIL while it waits, so measure it on the
+    panel (vsync_stalls_total, frame times) before turning it on.
+
+    If the swap thread dies, the error is raised from the next
+    acquire()/submit() instead of leaving the main loop waiting forever.
+
+        pipeline = RenderPipeline(display)
+        ...
+        canvas = pipeline.acquire()
+        if mgr.render(canvas):
+            pipeline.submit(tag=frame_id)
+        for tag, t in pipeline.completed():
+            ...  # frame `tag` reached the panel at time.monotonic() == t
+
+    acquire()/submit()/completed() belong to the main loop; nothing else
+    touches the canvases while they're queued.
+
+    With `diff` (a DiffPusher), acquire() hands out one software
+    ArrayCanvas instead, and submit() copies only what changed onto the
+    panel canvas. Each panel canvas travels with a shadow of what it last
+    held, since it still shows a frame from a few swaps ago.
+    """
+
+    def __init__(self, display, *, diff=None, threaded=False, clock=time.monotonic):
+        self.display = display
+        self.diff = diff
+        self.clock = clock
+        self._free = queue.Queue()  # (canvas, shadow)
+        for _ in range(2):  # + the one the panel shows = triple buffering
+            self._free.put((display.create_canvas(), None))
+        self._pending = queue.Queue(maxsize=1)
+        self._done = collections.deque()
+        self._back = None
+        self._front_shadow = None  # what the panel shows; None = unknown
+
+        self._frame = None
+        if diff is not None:
+            canvas, _ = self._free.queue[0]
+            self._frame = ArrayCanvas(canvas.width, canvas.height)
+
+        self.frames = 0       # frames that reached the panel
+        self.stalls = 0       # acquire() calls that had to wait for a vsync
+        self.stall_s = 0.0
+
+        self._error = None  # what killed the swap thread
+        self._thread = None
+        if threaded:
+            self._thread = threading.Thread(target=self._run, name="display-swap", daemon=True)
+            self._thread.start()
+
+    def _check(self):
+        if self._error is not None:
+            raise RuntimeError("display swap thread failed") from self._error
+
+    def _take_free(self):
+        self._check()
+        try:
+            return self._free.get_nowait()
+        except queue.Empty:
+            t0 = time.perf_counter()
+            item = self._free.get()
+            self.stalls += 1
+            self.stall_s += time.perf_counter() - t0
+            if item is None:  # put there by a dying swap thread
+                self._check()
+            return item
+
+    def acquire(self):
+        """
+        The canvas to draw the next frame into. Keeps returning the same
+        one until it's submitted, so it's fine to acquire and not draw.
+        """
+        if self._frame is not None:
+            return self._frame
+        if self._back is None:
+            self._back = self._take_free()
+        return self._back[0]
+
+    def submit(self, tag=None):
+        """Queue the acquired canvas for the next vsync and return at once."""
+        if self._frame is not None:
+            canvas, shadow = self._take_free()
+            shadow = self.diff.push(self._frame.array, canvas, shadow)
+        elif self._back is None:
+            raise RuntimeError("submit() without acquire()")
+        else:
+            (canvas, shadow), self._back = self._back, None
+
+        if self._thread is None:
+            self._show(canvas, shadow, tag)
+        else:
+            while True:  # don't block for good on a swap thread that died mid-frame
+                self._check()
+                try:
+                    self._pending.put((canvas, shadow, tag), timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+
+    def completed(self):
+        """Yield (tag, swap_time) for frames shown since the last call."""
+        while self._done:
+            yield self._done.popleft()
+
+    def _show(self, canvas, shadow, tag):
+        prev = self.display.swap(canvas)
+        t = self.clock()
+        self.frames += 1
+        self._done.append((tag, t))
+        self._free.put((prev, self._front_shadow))
+        self._front_shadow = shadow
+
+    def _run(self):
+        try:
+            while True:
+                item = self._pending.get()
+                if item is None:
+                    return
+                self._show(*item)
+        except BaseException as e:
+            self._error = e
+            self._free.put(None)  # wake a main loop waiting for a canvas
+
+    def close(self):
+        """Let the queued frame reach the panel, then stop the swap thread."""
+        if self._thread is None:
+            return
+        while self._thread.is_alive():
+            try:
+                self._pending.put(None, timeout=0.1)
+                break
+            except queue.Full:
+                continue  # thread busy swapping, or just died with a frame queued
+        self._thread.join()
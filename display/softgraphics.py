@@ -0,0 +1,88 @@
+"""
+Pure Python/NumPy stand-in for `rgbmatrix.graphics`.
+
+Same names and call signatures, so screens can't tell the difference.
+Drawing onto an ArrayCanvas writes straight into its array; any other
+canvas falls back to SetPixel.
+"""
+from .bdf import BdfFont
+from .canvas import ArrayCanvas
+
+
+class Color:
+    __slots__ = ("red", "green", "blue")
+
+    def __init__(self, red=0, green=0, blue=0):
+        self.red = red
+        self.green = green
+        self.blue = blue
+
+
+Font = BdfFont
+
+
+def _draw_glyph(canvas, g, x, y, color):
+    top = y - g.height - g.y_offset
+
+    if isinstance(canvas, ArrayCanvas):
+        x0, y0 = max(0, x), max(0, top)
+        x1 = min(canvas.width, x + g.width)
+        y1 = min(canvas.height, top + g.height)
+        if x0 < x1 and y0 < y1:
+            mask = g.mask[y0 - top:y1 - top, x0 - x:x1 - x]
+            canvas.array[y0:y1, x0:x1][mask] = (color.red, color.green, color.blue)
+        return
+
+    ys, xs = g.mask.nonzero()
+    for gy, gx in zip(ys.tolist(), xs.tolist()):
+        canvas.SetPixel(x + gx, top + gy, color.red, color.green, color.blue)
+
+
+def DrawText(canvas, font, x, y, color, text):
+    """
+    Draw text with its baseline at y. Returns the advance width in pixels.
+    """
+    start_x = x
+    for ch in text:
+        g = font.glyph(ord(ch))
+        if g is None:
+            continue
+        _draw_glyph(canvas, g, x, y, color)
+        x += g.dwidth
+    return x - start_x
+
+
+def DrawLine(canvas, x0, y0, x1, y1, color):
+    # Bresenham
+    dx, dy = abs(x1 - x0), -abs(y1 - y0)
+    sx = 1 if x0 < x1 else -1
+    sy = 1 if y0 < y1 else -1
+    err = dx + dy
+    while True:
+        canvas.SetPixel(x0, y0, color.red, color.green, color.blue)
+        if x0 == x1 and y0 == y1:
+            break
+        e2 = 2 * err
+        if e2 >= dy:
+            err += dy
+            x0 += sx
+        if e2 <= dx:
+            err += dx
+            y0 += sy
+
+
+def DrawCircle(canvas, x, y, radius, color):
+    # midpoint circle, outline only (like the C++ version)
+    r, g, b = color.red, color.green, color.blue
+    px, py = radius, 0
+    err = 1 - radius
+    while py <= px:
+        for ox, oy in ((px, py), (py, px), (-py, px), (-px, py),
+                       (-px, -py), (-py, -px), (py, -px), (px, -py)):
+            canvas.SetPixel(x + ox, y + oy, r, g, b)
+        py += 1
+        if err < 0:
+            err += 2 * py + 1
+        else:
+            px -= 1
+            err += 2 * (py - px) + 1
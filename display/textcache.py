@@ -0,0 +1,116 @@
+"""
+Pre-rasterized text.
+
+Strings are rendered once per (font, text, color) into an RGB bitmap and
+blitted onto the canvas with a single SetImage. Bitmaps are composed from
+cached per-glyph bitmaps, so a clock that changes every second reuses its
+digits instead of rasterizing them again.
+
+Blits are opaque over the text's box (font height x advance width), which
+matches DrawText on a cleared canvas.
+"""
+import numpy as np
+from PIL import Image
+
+from .canvas import ArrayCanvas
+from .lru import ByteLRU
+
+
+class TextBitmap:
+    __slots__ = ("array", "advance", "_image")
+
+    def __init__(self, array, advance):
+        self.array = array        # (font.height, w, 3) uint8
+        self.advance = advance    # x advance, what DrawText would return
+        self._image = None
+
+    @property
+    def image(self):
+        # PIL copy for canvases that only take PIL images (rgbmatrix)
+        if self._image is None:
+            self._image = Image.fromarray(self.array, "RGB")
+        return self._image
+
+    @property
+    def nbytes(self):
+        # budget for the lazy PIL copy too (PIL stores RGB as 4 bytes/pixel)
+        h, w = self.array.shape[:2]
+        return self.array.nbytes + h * w * 4
+
+
+def _rgb(color):
+    if isinstance(color, tuple):
+        return color
+    return (color.red, color.green, color.blue)
+
+
+class TextCache:
+    def __init__(self, max_bytes: int = 512 * 1024, glyph_max_bytes: int = 128 * 1024):
+        self.strings = ByteLRU(max_bytes)
+        self.glyphs = ByteLRU(glyph_max_bytes)
+
+    def _glyph(self, font, codepoint, rgb):
+        key = (font, codepoint, rgb)
+        entry = self.glyphs.get(key)
+        if entry is None:
+            g = font.glyph(codepoint)
+            if g is None:
+                return None, None
+            bmp = np.zeros((g.height, g.width, 3), dtype=np.uint8)
+            bmp[g.mask] = rgb
+            entry = (g, bmp)
+            self.glyphs.put(key, entry, bmp.nbytes)
+        return entry
+
+    def render(self, font, text: str, color) -> TextBitmap:
+        rgb = _rgb(color)
+        key = (font, text, rgb)
+        tb = self.strings.get(key)
+        if tb is not None:
+            return tb
+
+        placed = []
+        x = 0
+        right = 0
+        for ch in text:
+            g, bmp = self._glyph(font, ord(ch), rgb)
+            if g is None:
+                continue
+            placed.append((x, font.baseline - g.height - g.y_offset, bmp))
+            right = max(right, x + g.width)
+            x += g.dwidth
+
+        h = font.height
+        out = np.zeros((h, max(right, x, 1), 3), dtype=np.uint8)
+        for gx, gy, bmp in placed:
+            # clip glyph rows that poke outside the font box
+            y0, y1 = max(0, gy), min(h, gy + bmp.shape[0])
+            if y0 >= y1:
+                continue
+            region = out[y0:y1, gx:gx + bmp.shape[1]]
+            # max() == "OR" on a black background; glyph boxes may overlap
+            np.maximum(region, bmp[y0 - gy:y1 - gy, :region.shape[1]], out=region)
+
+        tb = TextBitmap(out, x)
+        self.strings.put(key, tb, tb.nbytes)
+        return tb
+
+    def draw(self, canvas, font, x, y, color, text: str) -> int:
+        """
+        Same arguments and return value as graphics.DrawText: y is the
+        baseline, the return value is the advance width in pixels.
+        """
+        tb = self.render(font, text, color)
+        top = y - font.baseline
+        if isinstance(canvas, ArrayCanvas):
+            canvas.SetImage(tb.array, x, top)
+        else:
+            canvas.SetImage(tb.image, x, top)
+        return tb.advance
+
+
+text_cache = TextCache()
+
+
+def draw_text(canvas, font, x, y, color, text: str) -> int:
+    return text_cache.draw(canvas, font, x, y, color, text)
@@ -0,0 +1,49 @@
+from PIL import Image
+
+from .canvas import ArrayCanvas
+
+
+class Viewport:
+    """
+    A rectangle of a panel canvas that screens can draw into as if it were
+    the whole canvas: coordinates are relative to (x, y) and nothing lands
+    outside the rectangle. For an ArrayCanvas use viewport(), which hands
+    back a zero-copy ArrayCanvas.region() instead.
+    """
+
+    def __init__(self, canvas, x: int, y: int, width: int, height: int):
+        self.canvas = canvas
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self._black = None
+
+    def Clear(self):
+        if self._black is None:
+            self._black = Image.new("RGB", (self.width, self.height))
+        self.canvas.SetImage(self._black, self.x, self.y)
+
+    def Fill(self, red, green, blue):
+        self.canvas.SetImage(Image.new("RGB", (self.width, self.height), (red, green, blue)), self.x, self.y)
+
+    def SetPixel(self, x, y, red, green, blue):
+        if 0 <= x < self.width and 0 <= y < self.height:
+            self.canvas.SetPixel(self.x + x, self.y + y, red, green, blue)
+
+    def SetImage(self, image, offset_x=0, offset_y=0, unsafe=True):
+        w, h = image.size
+        x0, y0 = max(0, offset_x), max(0, offset_y)
+        x1, y1 = min(self.width, offset_x + w), min(self.height, offset_y + h)
+        if x0 >= x1 or y0 >= y1:
+            return
+        if (x0, y0, x1, y1) != (offset_x, offset_y, offset_x + w, offset_y + h):
+            image = image.crop((x0 - offset_x, y0 - offset_y, x1 - offset_x, y1 - offset_y))
+        self.canvas.SetImage(image, self.x + x0, self.y + y0, unsafe)
+
+
+def viewport(canvas, x: int, y: int, width: int, height: int):
+    """Canvas for the (x, y, width, height) rectangle of `canvas`."""
+    if isinstance(canvas, ArrayCanvas):
+        return canvas.region(x, y, width, height)
+    return Viewport(canvas, x, y, width, height)
@@ -1 +1,2 @@
-from .ky040 import KY040Input
+from .events import Event, ROTATE, SHORT_CLICK, LONG_CLICK
+from .ky040 import KY040Input, accel_curve
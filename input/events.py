@@ -0,0 +1,30 @@
+"""
+Input events.
+
+One small __slots__ object per event instead of a dict, with an integer
+`kind` so dispatch is a plain int compare:
+
+    if event.kind == ROTATE:
+        self.index += event.delta
+"""
+
+ROTATE = 1
+SHORT_CLICK = 2
+LONG_CLICK = 3
+
+KIND_NAMES = {ROTATE: "ROTATE", SHORT_CLICK: "SHORT_CLICK", LONG_CLICK: "LONG_CLICK"}
+
+
+class Event:
+    __slots__ = ("kind", "delta", "t")
+
+    def __init__(self, kind: int, delta: int = 0, t: float = None):
+        self.kind = kind
+        self.delta = delta  # ROTATE only: detents, sign = direction
+        self.t = t          # detection time (time.monotonic() scale), or None
+
+    def __repr__(self):
+        name = KIND_NAMES.get(self.kind, str(self.kind))
+        if self.kind == ROTATE:
+            return f"Event({name}, delta={self.delta:+d}, t={self.t})"
+        return f"Event({name}, t={self.t})"
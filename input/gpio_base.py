@@ -0,0 +1,47 @@
+class GPIOBackend:
+    """
+    What KY040Input needs from a GPIO backend (RPi.GPIO-style names).
+
+    read_bank() is the fast path: the levels of GPIO 0-31 as one bitmask,
+    so CLK/DT/SW come from a single coherent snapshot instead of three
+    separate reads. The default builds it from input() for every pin
+    that's been set up; backends with a real bank read override it.
+    """
+    BCM = 0
+    IN = 0
+    PUD_UP = 2
+    PUD_DOWN = 1
+
+    def __init__(self):
+        self.pins = set()  # pins passed to setup()
+
+    def setwarnings(self, flag: bool):
+        pass
+
+    def setmode(self, mode):
+        pass
+
+    def setup(self, pin, direction, pull_up_down=None):
+        self.pins.add(pin)
+
+    def set_glitch_filter(self, pin, us: int):
+        pass
+
+    def input(self, pin):
+        raise NotImplementedError
+
+    def read_bank(self) -> int:
+        bits = 0
+        for pin in self.pins:
+            bits |= self.input(pin) << pin
+        return bits
+
+    def add_edge_callback(self, pin, fn):
+        """
+        Call fn(pin, level, tick) on every edge; tick is in microseconds and
+        wraps at 2**32 (pigpio convention). Returns a handle with cancel().
+        """
+        raise NotImplementedError(f"{type(self).__name__} has no edge callbacks; use poll mode")
+
+    def cleanup(self):
+        pass
@@ -0,0 +1,87 @@
+from .gpio_base import GPIOBackend
+
+
+class _Callback:
+    def __init__(self, owner, pin, fn):
+        self.owner = owner
+        self.pin = pin
+        self.fn = fn
+
+    def cancel(self):
+        cbs = self.owner._callbacks.get(self.pin, [])
+        if self in cbs:
+            cbs.remove(self)
+
+
+class FakeGPIO(GPIOBackend):
+    """
+    In-memory stand-in for PigpioGPIO, for running KY040Input without
+    hardware. Levels can be read (poll mode) and edges injected with a
+    pigpio-style microsecond tick (edge mode).
+
+        gpio = FakeGPIO()
+        enc = KY040Input(gpio, 18, 19, 25, q, mode="edge")
+        enc.start()
+        gpio.turn(18, 19, +1)        # one detent clockwise
+        gpio.press(25, hold_s=0.8)   # long press
+    """
+    # one quadrature step in each direction, state = (CLK<<1)|DT
+    CW = {0b11: 0b10, 0b10: 0b00, 0b00: 0b01, 0b01: 0b11}
+    CCW = {v: k for k, v in CW.items()}
+
+    def __init__(self):
+        super().__init__()
+        self.levels = {}
+        self.tick = 0  # microseconds, wraps like pigpio's
+        self._callbacks = {}
+
+    def setup(self, pin, direction, pull_up_down=None):
+        super().setup(pin, direction, pull_up_down)
+        self.levels.setdefault(pin, 1 if pull_up_down == self.PUD_UP else 0)
+
+    def input(self, pin):
+        return self.levels.get(pin, 0)
+
+    def read_bank(self) -> int:
+        bits = 0
+        for pin, level in self.levels.items():
+            bits |= level << pin
+        return bits
+
+    def add_edge_callback(self, pin, fn):
+        cb = _Callback(self, pin, fn)
+        self._callbacks.setdefault(pin, []).append(cb)
+        return cb
+
+    def cleanup(self):
+        self._callbacks.clear()
+
+    # ---------- injection ----------
+
+    def advance(self, us: int):
+        self.tick = (self.tick + int(us)) & 0xFFFFFFFF
+
+    def set(self, pin, level: int, *, after_us: int = 0):
+        """Drive a pin; fires edge callbacks if the level changed."""
+        self.advance(after_us)
+        if self.levels.get(pin) == level:
+            return
+        self.levels[pin] = level
+        for cb in list(self._callbacks.get(pin, ())):
+            cb.fn(pin, level, self.tick)
+
+    def turn(self, clk, dt, detents: int, *, steps_per_detent: int = 4, step_us: int = 2000):
+        """Rotate by whole detents (sign = direction), one pin change per step."""
+        table = self.CW if detents > 0 else self.CCW
+        for _ in range(abs(detents) * steps_per_detent):
+            state = (self.input(clk) << 1) | self.input(dt)
+            nxt = table[state]
+            if (nxt >> 1) != (state >> 1):
+                self.set(clk, nxt >> 1, after_us=step_us)
+            else:
+                self.set(dt, nxt & 1, after_us=step_us)
+
+    def press(self, sw, *, hold_s: float = 0.1, after_us: int = 50_000):
+        """Press and release the (active-low) button."""
+        self.set(sw, 0, after_us=after_us)
+        self.set(sw, 1, after_us=int(hold_s * 1_000_000))
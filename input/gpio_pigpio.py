@@ -1,23 +1,18 @@
 import pigpio
+from .gpio_base import GPIOBackend
 
-class PigpioGPIO:
-    BCM = 0
-    IN = 0
-    PUD_UP = 2
-    PUD_DOWN = 1
-
+class PigpioGPIO(GPIOBackend):
     def __init__(self):
+        super().__init__()
         self.pi = pigpio.pi()
         if not self.pi.connected:
             raise RuntimeError("pigpio daemon not running. Run: sudo systemctl enable --now pigpiod")
 
-    def setwarnings(self, flag: bool):
-        pass
-
     def setmode(self, mode):
         pass  # pigpio uses BCM numbering
 
     def setup(self, pin, direction, pull_up_down=None):
+        super().setup(pin, direction, pull_up_down)
         self.pi.set_mode(pin, pigpio.INPUT)
         if pull_up_down == self.PUD_UP:
             self.pi.set_pull_up_down(pin, pigpio.PUD_UP)
@@ -33,5 +28,14 @@ class PigpioGPIO:
     def input(self, pin):
         return self.pi.read(pin)
 
+    def read_bank(self) -> int:
+        # GPIO 0-31 in one daemon round trip, all sampled at the same instant
+        return self.pi.read_bank_1()
+
+    def add_edge_callback(self, pin, fn):
+        # fn(pin, level, tick) on pigpio's callback thread; tick is the edge
+        # time in microseconds (wraps at 2**32). Returns a handle with cancel().
+        return self.pi.callback(pin, pigpio.EITHER_EDGE, fn)
+
     def cleanup(self):
         self.pi.stop()
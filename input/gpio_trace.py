@@ -0,0 +1,150 @@
+import bisect
+import time
+
+from .gpio_base import GPIOBackend
+
+
+class TraceGPIO(GPIOBackend):
+    """
+    Replays a recorded (or synthesized) pin trace: a time-ordered list of
+    (t_seconds, bank_bits) snapshots, each one the GPIO 0-31 levels from
+    that moment on.
+
+    - Poll mode: read_bank()/input() return the snapshot in effect at
+      clock(); pass your own clock to step through a trace at any speed.
+    - Edge mode: play() fires the registered edge callbacks for every pin
+      change in the trace, with pigpio-style microsecond ticks.
+
+    Traces are plain text, one "t_seconds bank_hex" pair per line:
+    TraceGPIO.record() captures one from a real board, save()/load()
+    round-trip it, synthetic() generates knob turns and presses.
+    """
+
+    def __init__(self, trace, *, clock=None):
+        super().__init__()
+        self.trace = sorted(trace)
+        self._times = [t for t, _ in self.trace]
+        self._callbacks = {}
+        if clock is None:
+            t0 = time.monotonic()
+            clock = lambda: time.monotonic() - t0
+        self.clock = clock
+
+    # ---------- poll side ----------
+
+    def read_bank(self) -> int:
+        i = bisect.bisect_right(self._times, self.clock()) - 1
+        return self.trace[i][1] if i >= 0 else self.trace[0][1]
+
+    def input(self, pin):
+        return (self.read_bank() >> pin) & 1
+
+    # ---------- edge side ----------
+
+    def add_edge_callback(self, pin, fn):
+        handle = _Handle(self._callbacks, pin, fn)
+        self._callbacks.setdefault(pin, []).append(handle)
+        return handle
+
+    def play(self) -> int:
+        """Fire edge callbacks for the whole trace, as fast as possible. Returns edge count."""
+        edges = 0
+        prev = self.trace[0][1]
+        for t, bits in self.trace[1:]:
+            changed = bits ^ prev
+            prev = bits
+            tick = int(t * 1_000_000) & 0xFFFFFFFF
+            while changed:
+                low = changed & -changed
+                pin = low.bit_length() - 1
+                changed ^= low
+                for h in list(self._callbacks.get(pin, ())):
+                    h.fn(pin, (bits >> pin) & 1, tick)
+                edges += 1
+        return edges
+
+    # ---------- trace I/O ----------
+
+    @classmethod
+    def load(cls, path, **kw) -> "TraceGPIO":
+        trace = []
+        with open(path) as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    t, bits = line.split()
+                    trace.append((float(t), int(bits, 16)))
+        return cls(trace, **kw)
+
+    def save(self, path):
+        with open(path, "w") as f:
+            for t, bits in self.trace:
+                f.write(f"{t:.6f} {bits:08x}\n")
+
+    @staticmethod
+    def record(gpio, seconds: float, *, poll_s: float = 0.0002):
+        """Capture bank snapshots from a live backend; only changes are kept."""
+        trace = []
+        prev = None
+        t0 = time.monotonic()
+        while True:
+            now = time.monotonic() - t0
+            if now >= seconds:
+                break
+            bits = gpio.read_bank()
+            if bits != prev:
+                trace.append((now, bits))
+                prev = bits
+            time.sleep(poll_s)
+        return trace
+
+    @staticmethod
+    def synthetic(clk, dt, sw, moves, *, step_s: float = 0.002, steps_per_detent: int = 4):
+        """
+        Build a trace from a list of moves, starting idle-high:
+          ("turn", detents)   rotate (sign = direction), one step per step_s
+          ("press", hold_s)   press and release the button
+          ("wait", seconds)
+        """
+        cw = {0b11: 0b10, 0b10: 0b00, 0b00: 0b01, 0b01: 0b11}
+        ccw = {v: k for k, v in cw.items()}
+
+        levels = {clk: 1, dt: 1, sw: 1}
+        t = 0.0
+
+        def bank():
+            return sum(v << p for p, v in levels.items())
+
+        trace = [(t, bank())]
+        for kind, arg in moves:
+            if kind == "turn":
+                table = cw if arg > 0 else ccw
+                for _ in range(abs(arg) * steps_per_detent):
+                    state = table[(levels[clk] << 1) | levels[dt]]
+                    levels[clk], levels[dt] = state >> 1, state & 1
+                    t += step_s
+                    trace.append((t, bank()))
+            elif kind == "press":
+                t += 0.05
+                levels[sw] = 0
+                trace.append((t, bank()))
+                t += arg
+                levels[sw] = 1
+                trace.append((t, bank()))
+            elif kind == "wait":
+                t += arg
+            else:
+                raise ValueError(f"Unknown move {kind!r}")
+        return trace
+
+
+class _Handle:
+    def __init__(self, registry, pin, fn):
+        self.registry = registry
+        self.pin = pin
+        self.fn = fn
+
+    def cancel(self):
+        cbs = self.registry.get(self.pin, [])
+        if self in cbs:
+            cbs.remove(self)
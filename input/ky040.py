@@ -1,19 +1,68 @@
+import logging
 import time
 import threading
 
+from .events import Event, ROTATE, SHORT_CLICK, LONG_CLICK
+
+log = logging.getLogger(__name__)
+
+
+# Quadrature transition table
+# state is 2-bit: (CLK<<1)|DT
+TRANS = {
+    (0b00, 0b01): +1,
+    (0b01, 0b11): +1,
+    (0b11, 0b10): +1,
+    (0b10, 0b00): +1,
+
+    (0b00, 0b10): -1,
+    (0b10, 0b11): -1,
+    (0b11, 0b01): -1,
+    (0b01, 0b00): -1,
+}
+
+
+def accel_curve(*, threshold: float = 15.0, gain: float = 0.2, max_factor: int = 8):
+    """
+    Speed-based acceleration for KY040Input(accel=...): above `threshold`
+    detents/s each detent counts for more, up to max_factor.
+    """
+    def curve(delta: int, rate: float) -> int:
+        if rate <= threshold:
+            return delta
+        return delta * min(max_factor, 1 + int((rate - threshold) * gain))
+    return curve
+
 
 class KY040Input:
     """
-    Polling-based KY-040 input:
-      ROTATE:      {"type":"ROTATE","delta":+1/-1}
-      SHORT_CLICK: {"type":"SHORT_CLICK"}
-      LONG_CLICK:  {"type":"LONG_CLICK"}
+    KY-040 input, emits input.events.Event objects:
+      ROTATE:      Event(ROTATE, delta=+n/-n, t=...)
+      SHORT_CLICK: Event(SHORT_CLICK, t=...)
+      LONG_CLICK:  Event(LONG_CLICK, t=...)
+
+    t is when the input was detected, on the time.monotonic() scale
+    (for merged rotations: the first detent), for latency tracking.
 
     Key improvement vs your version:
     - Proper quadrature decode (CLK/DT) so slow turns register.
     - Emits exactly 1 ROTATE per detent via steps_per_detent.
+
+    Modes:
+    - "poll": a thread reads the pins every poll_s.
+    - "edge": pigpio edge callbacks (gpio.add_edge_callback) drive the same
+      decoder, timed with pigpio's edge ticks. No thread, no busy loop.
+
+    Coalescing (coalesce_s > 0): the first detent of a spin is sent right
+    away; further same-direction detents within coalesce_s are merged into
+    one ROTATE with |delta| > 1. A direction change flushes immediately.
+    accel: optional fn(delta, detents_per_s) -> delta, e.g. accel_curve().
+    clock: where t comes from (time.monotonic); a fake one for simulations.
     """
 
+    MODES = ("poll", "edge")
+    REANCHOR_S = 1.0  # edge mode: tick time this far behind the clock = missed wraps
+
     def __init__(
         self,
         gpio,
@@ -29,7 +78,14 @@ class KY040Input:
         invert_direction: bool = False,
         steps_per_detent: int = 4,        # TRY 2 first; if too sensitive, use 4; if too sluggish, use 1
         rot_debounce_s: float = 0.0005,   # minimum time between valid quad steps
+        mode: str = "poll",
+        coalesce_s: float = 0.0,          # merge window for fast spins; 0 = one event per detent
+        accel=None,
+        clock=time.monotonic,
     ):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown KY040Input mode {mode!r}; expected one of {self.MODES}")
+
         self.gpio = gpio
         self.clk = clk_pin
         self.dt = dt_pin
@@ -43,22 +99,46 @@ class KY040Input:
         self.invert_direction = invert_direction
         self.steps_per_detent = max(1, int(steps_per_detent))
         self.rot_debounce_s = rot_debounce_s
+        self.mode = mode
+        self.coalesce_s = coalesce_s
+        self.accel = accel
+        self.clock = clock
 
         self._stop = threading.Event()
         self._thread = None
+        self._callbacks = []
+        self.cpu_s = 0.0  # CPU time spent decoding (polling thread / edge callbacks)
 
         # rotation state
         self._last_state = 0
         self._accum = 0
         self._last_rot_time = 0.0
 
+        # coalescing state (touched from the encoder thread and the flush timer)
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._pending_t = 0.0
+        self._window_end = 0.0
+        self._last_detent = None
+        self._timer = None
+
         # button state
         self._pressed = False
         self._press_time = 0.0
         self._last_btn_edge = 0.0
         self._prev_sw = 1  # pull-up idle HIGH
 
-    def start(self):
+        # edge mode: pin levels as reported by callbacks, and tick -> seconds
+        self._clk_level = 1
+        self._dt_level = 1
+        self._last_tick = None
+        self._tick_time = 0.0
+
+    def setup(self):
+        """
+        Configure the pins and read their initial levels. start() does this
+        itself; call it directly only to drive poll_once() by hand.
+        """
         g = self.gpio
         g.setmode(g.BCM)
 
@@ -73,89 +153,228 @@ class KY040Input:
             g.set_glitch_filter(self.sw, 3000)   # 3ms for button
 
         # initial states
-        self._last_state = (g.input(self.clk) << 1) | g.input(self.dt)
+        self._clk_level = g.input(self.clk)
+        self._dt_level = g.input(self.dt)
+        self._last_state = (self._clk_level << 1) | self._dt_level
         self._prev_sw = g.input(self.sw)
 
+    def start(self):
+        self.setup()
+        g = self.gpio
+
+        if self.mode == "edge":
+            self._last_tick = None
+            self._callbacks = [g.add_edge_callback(pin, self._on_edge)
+                               for pin in (self.clk, self.dt, self.sw)]
+            return
+
         self._stop.clear()
         self._thread = threading.Thread(target=self._run, daemon=True)
         self._thread.start()
 
     def stop(self):
+        for cb in self._callbacks:
+            cb.cancel()
+        self._callbacks = []
+
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
         self._stop.set()
         if self._thread:
             self._thread.join(timeout=1.0)
 
-    def _emit_rotate(self, delta: int):
+    def _emit_rotate(self, delta: int, t: float):
+        # logging skips the formatting entirely unless DEBUG is on
+        log.debug("ROTATE %+d", delta)
+        self.q.put(Event(ROTATE, delta, t))
+
+    # ---------- detents -> ROTATE events ----------
+
+    def _detent(self, step: int, now: float):
         if self.invert_direction:
-            delta = -delta
-        print("DEBUG ROTATE", delta)
-        self.q.put({"type": "ROTATE", "delta": delta})
+            step = -step
 
-    def _emit_short(self):
-        print("DEBUG SHORT")
-        self.q.put({"type": "SHORT_CLICK"})
+        if self.accel is not None:
+            rate = 0.0
+            if self._last_detent is not None and now > self._last_detent:
+                rate = 1.0 / (now - self._last_detent)
+            step = self.accel(step, rate)
+        self._last_detent = now
 
-    def _emit_long(self):
-        print("DEBUG LONG")
-        self.q.put({"type": "LONG_CLICK"})
+        if self.coalesce_s <= 0:
+            self._emit_rotate(step, now)
+            return
 
-    def _run(self):
+        with self._lock:
+            if self._pending and (self._pending > 0) != (step > 0):
+                self._flush_locked()  # direction change: don't merge across it
+
+            if now < self._window_end:
+                if not self._pending:
+                    self._pending_t = now
+                self._pending += step
+                if self.mode == "edge" and self._timer is None:
+                    # no poll loop to notice the window closing; the timer gets the
+                    # deadline in decoder time so the next window stays on that scale
+                    self._timer = threading.Timer(self._window_end - now, self._flush_timer,
+                                                  args=(self._window_end,))
+                    self._timer.daemon = True
+                    self._timer.start()
+            else:
+                self._emit_rotate(step, now)
+                self._window_end = now + self.coalesce_s
+
+    def _flush_locked(self):
+        if self._pending:
+            self._emit_rotate(self._pending, self._pending_t)
+            self._pending = 0
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _flush_timer(self, now: float):
+        with self._lock:
+            self._timer = None
+            if self._pending:
+                self._flush_locked()
+                # keep merging while the knob is still spinning
+                self._window_end = now + self.coalesce_s
+
+    def _flush_due(self, now: float):
+        if self._pending and now >= self._window_end:
+            with self._lock:
+                self._flush_locked()
+                self._window_end = now + self.coalesce_s
+
+    def _emit_short(self, t: float):
+        log.debug("SHORT_CLICK")
+        self.q.put(Event(SHORT_CLICK, 0, t))
+
+    def _emit_long(self, t: float):
+        log.debug("LONG_CLICK")
+        self.q.put(Event(LONG_CLICK, 0, t))
+
+    # ---------- decoding (shared by both modes) ----------
+
+    def _rotation(self, state: int, now: float):
+        if state == self._last_state:
+            return
+        step = TRANS.get((self._last_state, state), 0)
+        self._last_state = state
+
+        # Filter out super-fast bounce steps
+        if step != 0 and (now - self._last_rot_time) >= self.rot_debounce_s:
+            self._last_rot_time = now
+            self._accum += step
+
+            # One detent per steps_per_detent quad steps
+            if self._accum >= self.steps_per_detent:
+                self._accum = 0
+                self._detent(+1, now)
+            elif self._accum <= -self.steps_per_detent:
+                self._accum = 0
+                self._detent(-1, now)
+
+    def _button(self, sw_state: int, now: float):
+        # SHORT vs LONG is decided on release
+        if sw_state != self._prev_sw and (now - self._last_btn_edge) > self.debounce_s:
+            self._last_btn_edge = now
+
+            if sw_state == 0 and not self._pressed:
+                self._pressed = True
+                self._press_time = now
+
+            elif sw_state == 1 and self._pressed:
+                self._pressed = False
+                held = now - self._press_time
+                if self._pending:
+                    with self._lock:
+                        self._flush_locked()  # keep events in order
+                if held >= self.long_press_s:
+                    self._emit_long(now)
+                else:
+                    self._emit_short(now)
+
+        self._prev_sw = sw_state
+
+    # ---------- poll mode ----------
+
+    def poll_once(self, now: float):
+        """
+        One poll: a single bank read gives CLK, DT and SW from the same
+        instant. Backends without read_bank() fall back to three reads.
+        """
         g = self.gpio
+        read_bank = getattr(g, "read_bank", None)
+        if read_bank is not None:
+            bank = read_bank()
+            clk = (bank >> self.clk) & 1
+            dt = (bank >> self.dt) & 1
+            sw = (bank >> self.sw) & 1
+        else:
+            clk, dt, sw = g.input(self.clk), g.input(self.dt), g.input(self.sw)
 
-        # Quadrature transition table
-        # state is 2-bit: (CLK<<1)|DT
-        TRANS = {
-            (0b00, 0b01): +1,
-            (0b01, 0b11): +1,
-            (0b11, 0b10): +1,
-            (0b10, 0b00): +1,
+        # ---------- ROTATION ----------
+        self._rotation((clk << 1) | dt, now)
 
-            (0b00, 0b10): -1,
-            (0b10, 0b11): -1,
-            (0b11, 0b01): -1,
-            (0b01, 0b00): -1,
-        }
+        # ---------- BUTTON (SHORT vs LONG) ----------
+        self._button(sw, now)
 
-        while not self._stop.is_set():
-            now = time.monotonic()
-
-            # ---------- ROTATION ----------
-            state = (g.input(self.clk) << 1) | g.input(self.dt)
-            if state != self._last_state:
-                step = TRANS.get((self._last_state, state), 0)
-                self._last_state = state
-
-                # Filter out super-fast bounce steps
-                if step != 0 and (now - self._last_rot_time) >= self.rot_debounce_s:
-                    self._last_rot_time = now
-                    self._accum += step
-
-                    # Emit one event per detent
-                    if self._accum >= self.steps_per_detent:
-                        self._accum = 0
-                        self._emit_rotate(+1)
-                    elif self._accum <= -self.steps_per_detent:
-                        self._accum = 0
-                        self._emit_rotate(-1)
-
-            # ---------- BUTTON (SHORT vs LONG) ----------
-            sw_state = g.input(self.sw)
-
-            if sw_state != self._prev_sw and (now - self._last_btn_edge) > self.debounce_s:
-                self._last_btn_edge = now
-
-                if sw_state == 0 and not self._pressed:
-                    self._pressed = True
-                    self._press_time = now
-
-                elif sw_state == 1 and self._pressed:
-                    self._pressed = False
-                    held = now - self._press_time
-                    if held >= self.long_press_s:
-                        self._emit_long()
-                    else:
-                        self._emit_short()
-
-            self._prev_sw = sw_state
+        # ---------- merged rotation whose window just closed ----------
+        self._flush_due(now)
 
+    def _run(self):
+        cpu0 = time.thread_time()
+        while not self._stop.is_set():
+            self.poll_once(self.clock())
+            self.cpu_s = time.thread_time() - cpu0
             time.sleep(self.poll_s)
+
+    # ---------- edge mode ----------
+
+    def _tick_to_time(self, tick: int) -> float:
+        """
+        pigpio ticks are microseconds since boot, wrapping at 2**32 (~71.6
+        min). Turn them into seconds on the time.monotonic() scale.
+
+        Edges close together are spaced by their tick delta, which is exact
+        and doesn't care how late the callback ran. After a long gap the
+        delta can't be trusted (the tick may have wrapped more than once),
+        so re-anchor on the clock: gaps of 2**31 us or more, or a tick time
+        that ended up well behind the clock.
+        """
+        now = self.clock()
+        if self._last_tick is None:
+            self._tick_time = now
+        else:
+            gap = (tick - self._last_tick) & 0xFFFFFFFF
+            t = self._tick_time + gap / 1_000_000
+            if gap >= 1 << 31 or t < now - self.REANCHOR_S:
+                t = max(now, self._tick_time)  # never step backwards
+            self._tick_time = t
+        self._last_tick = tick
+        return self._tick_time
+
+    def _on_edge(self, pin: int, level: int, tick: int):
+        # runs on pigpio's callback thread; level 2 means watchdog timeout
+        if level > 1:
+            return
+        cpu0 = time.thread_time()
+        self._decode_edge(pin, level, tick)
+        self.cpu_s += time.thread_time() - cpu0
+
+    def _decode_edge(self, pin: int, level: int, tick: int):
+        now = self._tick_to_time(tick)
+
+        if pin == self.sw:
+            self._button(level, now)
+            return
+
+        if pin == self.clk:
+            self._clk_level = level
+        else:
+            self._dt_level = level
+        self._rotation((self._clk_level << 1) | self._dt_level, now)
@@ -1,16 +1,34 @@
+import logging
+import os
 import time
 import queue
-from input.gpio_pigpio import PigpioGPIO
-GPIO = PigpioGPIO()
+import signal
+from functools import partial
 
 from input import KY040Input
-from display import MatrixDisplay
-from manager import ScreenManager
+from display import create_display, fonts, DiffPusher, RenderPipeline
+from manager import ScreenManager, FrameScheduler, IdleController, Slide
+from metrics import LatencyTracker, FrameStats, Exposition, MetricsServer, rss_bytes
+from timing import time_service
 from screens import ClockScreen, TextScreen, ImageScreen, CountdownScreen, StopwatchScreen
 
+log = logging.getLogger("led-dashboard")
+
+
+def _toggle_debug(start_level, *_):
+    # flip between the startup level and DEBUG (DEBUG at startup: INFO)
+    other = logging.DEBUG if start_level != logging.DEBUG else logging.INFO
+    root = logging.getLogger()
+    root.setLevel(start_level if root.level == other else other)
+    # at least INFO, so the switch back to e.g. WARNING still shows up
+    log.log(max(root.level, logging.INFO), "log level: %s", logging.getLevelName(root.level))
+
 
 def main():
     # -------- CONFIG YOU SHOULD EDIT --------
+    # "rgbmatrix" drives the panel; "headless" renders into NumPy buffers
+    # (no Pi needed, no knob). LED_BACKEND=headless overrides it.
+    BACKEND = os.environ.get("LED_BACKEND", "rgbmatrix")
     FONT_PATH = "/home/admin/rpi-rgb-led-matrix/fonts/5x7.bdf"
     IMAGES_DIR = "/home/admin/led-dashboard/images"
     # KY-040 pins (BCM numbering)
@@ -18,79 +36,196 @@ def main():
     CLK_PIN = 18
     DT_PIN  = 19 
     SW_PIN  = 25
+    # "edge" = pigpio edge callbacks (no busy loop), "poll" = 1 kHz polling thread
+    ENCODER_MODE = "edge"
 
     # Matrix options (tune to your setup)
     MATRIX_COLS = 64
     MATRIX_ROWS = 32
+    CHAIN_LENGTH = 1   # panels daisy-chained horizontally
+    PARALLEL = 1       # chains stacked vertically
     BRIGHTNESS = 60
     GPIO_MAPPING = "adafruit-hat"
     PANEL_TYPE = "FM6126A"  
     SLOWDOWN = 4
+    # Idle power saving: dim after this long without input, then sleep
+    # ("throttle" = cap the frame rate, "blank" = panel off); None = never
+    IDLE_DIM_AFTER_S = 120
+    IDLE_SLEEP_AFTER_S = 1800
+    IDLE_DIM_BRIGHTNESS = 15
+    IDLE_SLEEP = "throttle"
+    # Prometheus-style metrics on http://127.0.0.1:<port>/metrics (None = off)
+    METRICS_PORT = 9108
     # ---------------------------------------
 
+    # LED_LOG_LEVEL=DEBUG logs every knob event; `kill -USR2 <pid>` toggles
+    # DEBUG on and off while running
+    logging.basicConfig(level=os.environ.get("LED_LOG_LEVEL", "INFO").upper(),
+                        format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    signal.signal(signal.SIGUSR2, partial(_toggle_debug, logging.getLogger().level))
+
     events = queue.Queue()
 
-    display = MatrixDisplay(
+    # the knob only exists on the Pi; connect to pigpiod before the matrix starts
+    gpio = None
+    if BACKEND == "rgbmatrix":
+        from input.gpio_pigpio import PigpioGPIO
+        gpio = PigpioGPIO()
+
+    display = create_display(
+        BACKEND,
         cols=MATRIX_COLS,
         rows=MATRIX_ROWS,
+        chain_length=CHAIN_LENGTH,
+        parallel=PARALLEL,
         brightness=BRIGHTNESS,
         gpio_mapping=GPIO_MAPPING,
         panel_type=PANEL_TYPE,
         slowdown_gpio=SLOWDOWN,
     )
 
+    # parse each font file once, up front; every screen shares the result
+    fonts.prewarm(FONT_PATH)
+    log.info("%s", fonts.report())
+
+    # factories: each screen is built on first use (neighbours are pre-warmed
+    # in the background), so boot only pays for the first one
     screens = [
-        ClockScreen(FONT_PATH),
-        TextScreen(FONT_PATH, "Salaam!"),
-        ImageScreen("/home/admin/led-dashboard/images/house.png"),
-        CountdownScreen(FONT_PATH),
-        StopwatchScreen(FONT_PATH, IMAGES_DIR, width=25, height=25, anim_fps=2.0)
+        partial(ClockScreen, FONT_PATH),
+        partial(TextScreen, FONT_PATH, "Salaam!"),
+        partial(ImageScreen, "/home/admin/led-dashboard/images/house.png"),
+        partial(CountdownScreen, FONT_PATH),
+        partial(StopwatchScreen, FONT_PATH, IMAGES_DIR, width=25, height=25, anim_fps=2.0),
+        # long clips: convert once with `python -m assets.framefile`, then
+        # (with AnimationScreen imported from screens)
+        # partial(AnimationScreen, "/home/admin/led-dashboard/anim/clip.ledf"),
+        # bigger walls: several screens at once, each in its own 64x32 tile
+        # (TiledScreen, also from screens)
+        # (display.width x display.height is the whole chain), e.g. on 128x32:
+        # lambda: TiledScreen.grid([ClockScreen(FONT_PATH), CountdownScreen(FONT_PATH)], columns=2),
     ]
-    mgr = ScreenManager(screens)
-
-    encoder = KY040Input(
-        gpio=GPIO,
-        clk_pin=CLK_PIN,
-        dt_pin=DT_PIN,
-        sw_pin=SW_PIN,
-        out_queue=events,
-        long_press_s=0.60,
-        debounce_s=0.03,
-        poll_s=0.001,
-        invert_direction=False,  # set True if rotation direction feels backwards
-    )
-    encoder.start()
-
-    canvas = display.create_canvas()
+    mgr = ScreenManager(screens, transition=Slide(0.25))  # or Wipe / Crossfade / None
+
+    encoder = None
+    if gpio is not None:
+        encoder = KY040Input(
+            gpio=gpio,
+            clk_pin=CLK_PIN,
+            dt_pin=DT_PIN,
+            sw_pin=SW_PIN,
+            out_queue=events,
+            long_press_s=0.60,
+            debounce_s=0.03,
+            poll_s=0.001,
+            invert_direction=False,  # set True if rotation direction feels backwards
+            mode=ENCODER_MODE,
+            coalesce_s=0.04,  # fast spins arrive as one ROTATE with |delta| > 1
+            # accel=accel_curve(),  # from input; uncomment to make fast spins jump further
+        )
+        encoder.start()
+
+    # frames are drawn in software and only the changed pixels are pushed;
+    # threaded=True waits on vsync in a background thread while the next
+    # frame is drawn (measure it on the panel before turning it on)
+    pusher = DiffPusher()
+    pipeline = RenderPipeline(display, diff=pusher)
+    scheduler = FrameScheduler(events, max_fps=60.0)
+    idle = IdleController(display, mgr, dim_after_s=IDLE_DIM_AFTER_S, sleep_after_s=IDLE_SLEEP_AFTER_S,
+                          dim_brightness=IDLE_DIM_BRIGHTNESS, sleep=IDLE_SLEEP,
+                          on_change=pusher.forget)  # brightness change: repush every pixel
     last = time.monotonic()
 
+    # knob -> panel latency; `kill -USR1 <pid>` logs the histograms
+    latency = LatencyTracker()
+    signal.signal(signal.SIGUSR1, lambda *_: log.info("%s\n%s", latency.report(), pusher.report()))
+
+    frame_stats = FrameStats()
+
+    def collect():
+        m = Exposition()
+        for phase, h in frame_stats.hist.items():
+            m.histogram("frame_phase_seconds", h, "Main loop time per phase", {"phase": phase})
+        for stage, h in latency.hist.items():
+            m.histogram("input_latency_seconds", h, "Knob to panel latency per stage", {"stage": stage})
+        m.counter("loops_total", frame_stats.loops, "Main loop iterations")
+        m.counter("frames_drawn_total", frame_stats.drawn, "Frames rendered and submitted")
+        m.counter("frames_shown_total", pipeline.frames, "Frames that reached the panel")
+        m.counter("frames_late_total", scheduler.late, "Frames started well after their deadline")
+        m.counter("frames_dropped_total", scheduler.dropped, "Frame periods skipped after falling behind")
+        m.counter("vsync_stalls_total", pipeline.stalls, "Times drawing waited for a free canvas")
+        m.counter("pixels_written_total", pusher.pixels_written, "Pixels written to the panel")
+        m.counter("pixels_full_total", pusher.pixels_total, "Pixels full-frame pushes would have written")
+        m.gauge("event_queue_depth", events.qsize(), "Input events waiting")
+        m.counter("encoder_cpu_seconds_total", encoder.cpu_s if encoder else 0.0, "CPU time spent decoding the knob")
+        m.counter("process_cpu_seconds_total", time.process_time(), "CPU time of the whole process")
+        m.gauge("process_resident_memory_bytes", rss_bytes(), "Resident set size")
+        m.gauge("screen_index", mgr.idx, "Index of the screen showing")
+        m.gauge("idle_state", ("active", "dim", "sleep").index(idle.state), "0 active, 1 dim, 2 sleep")
+        return m
+
+    exporter = None
+    if METRICS_PORT is not None:
+        exporter = MetricsServer(collect, port=METRICS_PORT)
+        exporter.start()
+
     try:
         while True:
+            # 0) sleep until the current screen's next frame is due, the
+            #    next clock second, or an input event (whichever comes first)
+            ev = scheduler.wait(idle.frame_rate(mgr.frame_rate()), wake_in=time_service.until_next())
+
+            t0 = time.perf_counter()
             now = time.monotonic()
             dt = now - last
             last = now
 
             # 1) handle all pending input events
-            while True:
+            while ev is not None:
+                log.debug("%r", ev)
+                latency.dequeued(ev, time.monotonic())
+                if idle.input(now):  # False: it only woke the blank panel
+                    mgr.handle(ev)
                 try:
                     ev = events.get_nowait()
-                    print(ev)
                 except queue.Empty:
-                    break
-                mgr.handle(ev)
+                    ev = None
+            t_input = time.perf_counter()
 
-            # 2) update time-based state
+            # 2) update time-based state; the time service reads the wall
+            #    clock once and fires second/minute callbacks and timers
+            time_service.tick()
             mgr.current.update(dt)
-
-            # 3) draw current screen
-            mgr.current.draw(canvas)
-            canvas = display.swap(canvas)
-
-            # ~60 FPS cap
-            time.sleep(1 / 60)
+            idle.poll(now)
+            t_update = time.perf_counter()
+
+            # 3) draw current screen, skipping clear/draw/swap if nothing changed;
+            #    submit() hands it to the swap thread and returns right away
+            if idle.blank:
+                # asleep with the panel off: one black frame, then nothing
+                drawn = idle.blank_pending
+                if drawn:
+                    pipeline.acquire().Clear()
+                    idle.blank_pending = False
+            else:
+                drawn = mgr.dirty and mgr.render(pipeline.acquire())
+            t_draw = time.perf_counter()
+            if drawn:
+                pipeline.submit(tag=latency.drawn(time.monotonic()))
+            else:
+                latency.discard()
+            frame_stats.record(t0, t_input, t_update, t_draw, time.perf_counter(), drawn)
+
+            for frame, t in pipeline.completed():
+                latency.swapped(t, frame)
     finally:
-        encoder.stop()
-        GPIO.cleanup()
+        if exporter is not None:
+            exporter.stop()
+        pipeline.close()
+        mgr.close()  # e.g. unmaps AnimationScreen frame files
+        if encoder is not None:
+            encoder.stop()
+        if gpio is not None:
+            gpio.cleanup()
 
 
 if __name__ == "__main__":
@@ -1 +1,4 @@
 from .screen_manager import ScreenManager
+from .scheduler import FrameScheduler
+from .idle import IdleController
+from .transitions import TRANSITIONS, Transition, Slide, Wipe, Crossfade
@@ -0,0 +1,88 @@
+import logging
+import time
+
+log = logging.getLogger(__name__)
+
+ACTIVE = "active"
+DIM = "dim"
+SLEEP = "sleep"
+
+
+class IdleController:
+    """
+    Power saving for always-on units, driven by input activity.
+
+      active  normal brightness and frame rate
+      dim     after dim_after_s without input: brightness -> dim_brightness
+      sleep   after sleep_after_s: frame rate capped at sleep_fps
+              (sleep="throttle"), or the panel goes black and nothing is
+              drawn at all (sleep="blank")
+
+    Any input event goes back to active at once. The event that wakes a
+    blank panel is swallowed, so a click only lights it up instead of also
+    acting on a screen nobody could see.
+
+    Brightness on the panel only applies to pixels drawn after the change,
+    so every state change invalidates the current screen and calls
+    on_change() (e.g. DiffPusher.forget) so the next frame is pushed whole.
+    """
+
+    def __init__(self, display, manager, *, dim_after_s=120.0, sleep_after_s=1800.0,
+                 dim_brightness=15, sleep="throttle", sleep_fps=5.0, on_change=None,
+                 clock=time.monotonic):
+        if sleep not in ("throttle", "blank"):
+            raise ValueError(f"sleep must be 'throttle' or 'blank', not {sleep!r}")
+        self.display = display
+        self.manager = manager
+        self.dim_after_s = dim_after_s
+        self.sleep_after_s = sleep_after_s
+        self.dim_brightness = dim_brightness
+        self.sleep = sleep
+        self.sleep_fps = sleep_fps
+        self.on_change = on_change
+        self.clock = clock
+
+        self.brightness = display.brightness  # the "awake" level
+        self.state = ACTIVE
+        self.last_input = clock()
+        self.blank_pending = False  # a black frame still has to be pushed
+
+    @property
+    def blank(self) -> bool:
+        return self.state == SLEEP and self.sleep == "blank"
+
+    def input(self, now: float = None) -> bool:
+        """
+        Call for every input event. Returns False if the event should be
+        dropped (it only woke a blank panel).
+        """
+        self.last_input = self.clock() if now is None else now
+        if self.state == ACTIVE:
+            return True
+        was_blank = self.blank
+        self._enter(ACTIVE)
+        return not was_blank
+
+    def poll(self, now: float = None):
+        """Call once per loop iteration; moves to dim / sleep when it's time."""
+        idle = (self.clock() if now is None else now) - self.last_input
+        if self.state != SLEEP and self.sleep_after_s is not None and idle >= self.sleep_after_s:
+            self._enter(SLEEP)
+        elif self.state == ACTIVE and self.dim_after_s is not None and idle >= self.dim_after_s:
+            self._enter(DIM)
+
+    def frame_rate(self, fps: float) -> float:
+        """Cap the frame rate the scheduler gets while asleep."""
+        if self.state != SLEEP:
+            return fps
+        return 0.0 if self.blank else min(fps, self.sleep_fps)
+
+    def _enter(self, state: str):
+        log.info("idle: %s -> %s", self.state, state)
+        self.state = state
+        level = self.brightness if state == ACTIVE else min(self.brightness, self.dim_brightness)
+        self.display.brightness = level
+        self.blank_pending = self.blank
+        self.manager.current.invalidate()
+        if self.on_change is not None:
+            self.on_change()
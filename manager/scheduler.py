@@ -0,0 +1,68 @@
+import queue
+import time
+
+
+class FrameScheduler:
+    """
+    Paces the main loop on absolute frame deadlines.
+
+    - Each frame is due one period after the previous deadline (not after
+      the previous frame finished), so draw time doesn't drag the rate down.
+    - The period comes from the current screen's frame_rate(), clamped to
+      [min_fps, max_fps]; a screen that only changes on input can ask for 0.
+    - Waiting is done on the event queue itself, so a knob event wakes the
+      loop right away instead of after a blind sleep.
+
+    Counters: `frames` deadlines reached, `late` of those started more than
+    late_frac of a period after their deadline, `dropped` whole periods
+    skipped when the loop fell behind and resynced.
+    """
+
+    late_frac = 0.25
+
+    def __init__(self, events, *, max_fps=60.0, min_fps=1.0, clock=time.monotonic):
+        self.events = events
+        self.max_fps = max_fps
+        self.min_fps = min_fps
+        self.clock = clock
+        self._last_deadline = clock()
+        self.frames = 0
+        self.late = 0
+        self.dropped = 0
+
+    def period(self, fps) -> float:
+        fps = min(max(fps or 0.0, self.min_fps), self.max_fps)
+        return 1.0 / fps
+
+    def wait(self, fps, wake_in=None):
+        """
+        Block until the next frame is due or an input event arrives.
+        Returns the event, or None when the frame deadline was reached.
+        `wake_in` (seconds) pulls the deadline in, e.g. to land a frame
+        right on the next clock second; pacing continues from there.
+        """
+        # recomputed every call so a screen switch picks up the new rate at once
+        period = self.period(fps)
+        deadline = self._last_deadline + period
+
+        now = self.clock()
+        if wake_in is not None and now + wake_in < deadline:
+            deadline = now + wake_in
+        timeout = deadline - now
+        if timeout > 0:
+            try:
+                return self.events.get(timeout=timeout)
+            except queue.Empty:
+                pass
+
+        now = self.clock()
+        lateness = now - deadline
+        self.frames += 1
+        if lateness > period * self.late_frac:
+            self.late += 1
+        if lateness >= period:
+            # fell more than a whole frame behind: resync instead of bursting
+            self.dropped += int(lateness / period)
+            deadline = now
+        self._last_deadline = deadline
+        return None
@@ -1,3 +1,37 @@
+import logging
+import threading
+import time
+
+import numpy as np
+from PIL import Image
+
+from display import ArrayCanvas
+from input.events import Event, ROTATE
+from screens.base import Screen
+
+log = logging.getLogger(__name__)
+
+
+class _Slot:
+    __slots__ = ("factory", "screen", "lock")
+
+    def __init__(self, item):
+        if isinstance(item, Screen):
+            self.factory = None
+            self.screen = item
+        else:
+            self.factory = item
+            self.screen = None
+        self.lock = threading.Lock()
+
+    def build(self) -> Screen:
+        if self.screen is None:
+            with self.lock:
+                if self.screen is None:  # a pre-warm thread may have beaten us
+                    self.screen = self.factory()
+        return self.screen
+
+
 class ScreenManager:
     """
     Owns which screen is active and routes input events.
@@ -6,42 +40,173 @@ class ScreenManager:
       1) Current screen gets first chance: current.handle(event)
       2) If it returns False, apply global fallback:
          - ROTATE changes screens
+
+    `screens` may mix built Screen objects and zero-argument factories
+    (e.g. functools.partial(ClockScreen, FONT_PATH)). A factory is only
+    called when its screen is first needed; while a screen is showing, its
+    neighbours (idx +/- 1) are built on a background thread so rotating
+    to them doesn't stall.
+
+    `transition` (see manager.transitions, e.g. Slide(0.25)) animates screen
+    changes: the outgoing screen is drawn once into an offscreen array, the
+    incoming one keeps drawing into another, and each frame is blended in
+    NumPy and pushed with a single SetImage. Use frame_rate() and dirty
+    from the manager (not the current screen) to keep the main loop at
+    transition_fps while one runs.
     """
 
-    def __init__(self, screens):
+    transition_fps = 60.0
+
+    def __init__(self, screens, *, prewarm: bool = True, transition=None, clock=time.monotonic):
         if not screens:
             raise ValueError("ScreenManager requires at least one screen.")
-        self.screens = screens
+        self._slots = [_Slot(s) for s in screens]
+        self.prewarm = prewarm
+        self.transition = transition
+        self.clock = clock
+        self._size = None         # (w, h) of the canvases render() gets
+        self._bufs = None         # (from, to canvas, frame) for that size
+        self._trans_start = None  # set while a transition is running
         self.idx = 0
-        self.screens[self.idx].on_enter()
+        self._current = self._slots[0].build()
+        self._current.on_enter()
+        self._prewarm_neighbours()
 
     @property
     def current(self):
-        return self.screens[self.idx]
+        return self._current
+
+    def __len__(self):
+        return len(self._slots)
+
+    @property
+    def in_transition(self) -> bool:
+        return self._trans_start is not None
+
+    @property
+    def dirty(self) -> bool:
+        return self.in_transition or self.current.dirty
+
+    def frame_rate(self) -> float:
+        return self.transition_fps if self.in_transition else self.current.frame_rate()
+
+    def close(self):
+        """Leave the current screen and close() every screen built so far."""
+        self.current.on_exit()
+        for slot in self._slots:
+            with slot.lock:  # wait out a pre-warm build in progress
+                screen = slot.screen
+            if screen is not None:
+                try:
+                    screen.close()
+                except Exception:
+                    log.exception("closing %s failed", screen.name)
+
+    def _prewarm_neighbours(self):
+        if not self.prewarm:
+            return
+        n = len(self._slots)
+        todo = [i for i in dict.fromkeys(((self.idx + 1) % n, (self.idx - 1) % n))
+                if self._slots[i].screen is None]
+        if todo:
+            threading.Thread(target=self._build_in_background, args=(todo,),
+                             name="screen-prewarm", daemon=True).start()
+
+    def _build_in_background(self, indices):
+        for i in indices:
+            try:
+                self._slots[i].build()
+            except Exception:
+                # leave it unbuilt; entering the screen retries and raises in the main loop
+                log.exception("pre-warming screen %d failed", i)
+
+    def _buffers(self):
+        w, h = self._size
+        if self._bufs is None or self._bufs[1].width != w or self._bufs[1].height != h:
+            self._bufs = (np.zeros((h, w, 3), dtype=np.uint8), ArrayCanvas(w, h),
+                          np.zeros((h, w, 3), dtype=np.uint8))
+        return self._bufs
+
+    def _start_transition(self):
+        src, _, frame = self._buffers()
+        if self.in_transition:
+            # switching again mid-transition: continue from what's showing
+            src[:] = frame
+        else:
+            snap = ArrayCanvas(*self._size)
+            self.current.draw(snap)
+            src[:] = snap.array
+        self._trans_start = self.clock()
 
     def _switch_to(self, new_idx: int):
         if new_idx == self.idx:
             return
+        if self.transition is not None and self._size is not None:
+            self._start_transition()
         self.current.on_exit()
         self.idx = new_idx
+        self._current = self._slots[new_idx].build()
         self.current.on_enter()
+        # whatever is on the panel belongs to the old screen
+        self.current.invalidate()
+        self._prewarm_neighbours()
 
-    def next(self):
-        new_idx = (self.idx + 1) % len(self.screens)
+    def step(self, delta: int):
+        """
+        Move `delta` screens at once. Only the destination is entered; the
+        screens in between are skipped (not even built).
+        """
+        new_idx = (self.idx + delta) % len(self._slots)
         self._switch_to(new_idx)
 
+    def next(self):
+        self.step(+1)
+
     def prev(self):
-        new_idx = (self.idx - 1) % len(self.screens)
-        self._switch_to(new_idx)
+        self.step(-1)
+
+    def _render_transition(self, canvas, p: float):
+        src, dst, frame = self._buffers()
+        screen = self.current
+        if screen.dirty:
+            screen.dirty = False
+            dst.Clear()
+            screen.draw(dst)
+        self.transition.blend(frame, src, dst.array, p)
+        if isinstance(canvas, ArrayCanvas):
+            canvas.SetImage(frame, 0, 0)
+        else:
+            canvas.SetImage(Image.fromarray(frame), 0, 0)
+
+    def render(self, canvas) -> bool:
+        """
+        Draw the current screen onto canvas, but only if it changed.
+        Returns True if the canvas was drawn (and needs swapping).
+        """
+        self._size = (canvas.width, canvas.height)
+        if self.in_transition:
+            elapsed = self.clock() - self._trans_start
+            p = elapsed / self.transition.duration if self.transition.duration > 0 else 1.0
+            if p < 1.0:
+                self._render_transition(canvas, p)
+                return True
+            # done: back to drawing the screen straight onto the canvas
+            self._trans_start = None
+            self.current.invalidate()
+
+        screen = self.current
+        if not screen.dirty:
+            return False
+        # clear first so draw() may invalidate again for continuous animation
+        screen.dirty = False
+        screen.draw(canvas)
+        return True
 
-    def handle(self, event: dict):
+    def handle(self, event: Event):
         # Screen-local first
         if self.current.handle(event):
             return
 
-        # Global fallback: rotate changes screen
-        if event.get("type") == "ROTATE":
-            if event.get("delta", 0) > 0:
-                self.next()
-            else:
-                self.prev()
+        # Global fallback: rotate changes screen (by the whole delta)
+        if event.kind == ROTATE:
+            self.step(event.delta)
@@ -0,0 +1,97 @@
+import numpy as np
+
+
+def _oriented(arr, direction):
+    """
+    View of an (h, w, 3) array turned so every direction becomes "left":
+    content moves towards column 0, new content comes in from the end.
+    Views only, so writing through them writes the original array.
+    """
+    if direction == "left":
+        return arr
+    if direction == "right":
+        return arr[:, ::-1]
+    if direction == "up":
+        return arr.swapaxes(0, 1)
+    if direction == "down":
+        return arr[::-1].swapaxes(0, 1)
+    raise ValueError(f"Unknown direction {direction!r}; expected left/right/up/down")
+
+
+class Transition:
+    """
+    Blends the outgoing frame `a` into the incoming frame `b`.
+
+    blend(out, a, b, p) writes the frame at progress p (0..1) into `out`;
+    all three are (h, w, 3) uint8 arrays of the same shape. Implementations
+    only do whole-array NumPy ops and keep their scratch buffers, so a
+    transition frame allocates nothing.
+    """
+
+    name = "cut"
+
+    def __init__(self, duration: float = 0.3):
+        self.duration = duration
+
+    def blend(self, out, a, b, p: float):
+        out[:] = b if p >= 1.0 else a
+
+
+class Slide(Transition):
+    """The incoming screen pushes the outgoing one off the panel."""
+
+    name = "slide"
+
+    def __init__(self, duration: float = 0.3, direction: str = "left"):
+        super().__init__(duration)
+        self.direction = direction
+
+    def blend(self, out, a, b, p: float):
+        o, a, b = (_oriented(x, self.direction) for x in (out, a, b))
+        n = o.shape[1]
+        s = min(n, int(round(p * n)))
+        o[:, :n - s] = a[:, s:]
+        o[:, n - s:] = b[:, :s]
+
+
+class Wipe(Transition):
+    """The incoming screen is uncovered by an edge moving across the panel."""
+
+    name = "wipe"
+
+    def __init__(self, duration: float = 0.3, direction: str = "left"):
+        super().__init__(duration)
+        self.direction = direction
+
+    def blend(self, out, a, b, p: float):
+        o, a, b = (_oriented(x, self.direction) for x in (out, a, b))
+        n = o.shape[1]
+        s = min(n, int(round(p * n)))
+        # "left": the edge moves right to left, like Slide
+        o[:, :n - s] = a[:, :n - s]
+        o[:, n - s:] = b[:, n - s:]
+
+
+class Crossfade(Transition):
+    """Linear fade, in 8.8 fixed point on uint16 scratch buffers."""
+
+    name = "crossfade"
+
+    def __init__(self, duration: float = 0.3):
+        super().__init__(duration)
+        self._ta = None
+        self._tb = None
+
+    def blend(self, out, a, b, p: float):
+        if self._ta is None or self._ta.shape != out.shape:
+            self._ta = np.empty(out.shape, dtype=np.uint16)
+            self._tb = np.empty(out.shape, dtype=np.uint16)
+        k = min(256, max(0, int(p * 256)))
+        np.multiply(a, 256 - k, out=self._ta, dtype=np.uint16)
+        np.multiply(b, k, out=self._tb, dtype=np.uint16)
+        self._ta += self._tb
+        self._ta >>= 8
+        np.copyto(out, self._ta, casting="unsafe")
+
+
+TRANSITIONS = {t.name: t for t in (Transition, Slide, Wipe, Crossfade)}
@@ -0,0 +1,4 @@
+from .histogram import Histogram
+from .latency import LatencyTracker
+from .frames import FrameStats
+from .prometheus import Exposition, MetricsServer, rss_bytes
@@ -0,0 +1,64 @@
+import bisect
+
+
+def _default_bounds():
+    # 50 us .. ~13 s, sqrt(2) apart: ~41% resolution
+    bounds = []
+    b = 50e-6
+    while b < 15.0:
+        bounds.append(b)
+        b *= 2 ** 0.5
+    return tuple(bounds)
+
+
+DEFAULT_BOUNDS = _default_bounds()
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram of durations in seconds. record() is a bisect
+    and two adds, so it's cheap enough for every frame. Percentiles are
+    estimated as the upper bound of the bucket holding that rank.
+    """
+
+    __slots__ = ("bounds", "counts", "count", "sum", "max")
+
+    def __init__(self, bounds=DEFAULT_BOUNDS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # last bucket: > bounds[-1]
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def record(self, value: float):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, p: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = p / 100.0 * self.count
+        seen = 0
+        for i, c in enumerate(self.counts):
+            seen += c
+            if seen >= rank and c:
+                return min(self.bounds[i], self.max) if i < len(self.bounds) else self.max
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    def reset(self):
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def summary_ms(self) -> str:
+        return (f"n={self.count:<6} mean={self.mean * 1000:7.2f}  p50<={self.percentile(50) * 1000:7.2f}  "
+                f"p95<={self.percentile(95) * 1000:7.2f}  p99<={self.percentile(99) * 1000:7.2f}  "
+                f"max={self.max * 1000:7.2f} ms")
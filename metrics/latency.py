@@ -0,0 +1,79 @@
+from .histogram import Histogram
+
+
+class LatencyTracker:
+    """
+    Input-to-photon latency, split into stages:
+
+      detect_dequeue  encoder detected the input -> main loop took it off the queue
+      dequeue_draw    dequeued -> handled, updated and drawn
+      draw_swap       drawn -> display.swap() returned (frame on the panel)
+      total           detected -> on the panel
+
+    The main loop calls dequeued() per event, then drawn() and swapped()
+    around the swap, or discard() when the frame wasn't redrawn. Events
+    need a .t timestamp on the time.monotonic() scale (KY040Input adds it).
+
+    With a threaded RenderPipeline the swap finishes on another thread, possibly
+    after the next frame was drawn: pass the id drawn() returned to
+    swapped() so each frame's events are matched to its own swap.
+    Not thread-safe: use it from the main loop only.
+    """
+
+    STAGES = ("detect_dequeue", "dequeue_draw", "draw_swap", "total")
+
+    def __init__(self):
+        self.hist = {stage: Histogram() for stage in self.STAGES}
+        self._dequeued = []  # (t_detect, t_dequeue) waiting for a draw
+        self._drawn = []     # (frame, t_detect, t_drawn) waiting for the swap
+        self._frame = 0
+
+    def dequeued(self, event, now: float):
+        t = event.t
+        if t is None:
+            return
+        self.hist["detect_dequeue"].record(now - t)
+        self._dequeued.append((t, now))
+
+    def drawn(self, now: float) -> int:
+        """Returns an id for this frame, for swapped()."""
+        self._frame += 1
+        if not self._dequeued:
+            return self._frame
+        h = self.hist["dequeue_draw"]
+        for t_detect, t_dq in self._dequeued:
+            h.record(now - t_dq)
+            self._drawn.append((self._frame, t_detect, now))
+        self._dequeued.clear()
+        return self._frame
+
+    def swapped(self, now: float, frame: int = None):
+        """Frame `frame` (default: the last one drawn) is on the panel."""
+        if not self._drawn:
+            return
+        if frame is None:
+            frame = self._frame
+        h_swap, h_total = self.hist["draw_swap"], self.hist["total"]
+        keep = []
+        for entry in self._drawn:
+            f, t_detect, t_drawn = entry
+            if f > frame:
+                keep.append(entry)
+                continue
+            h_swap.record(now - t_drawn)
+            h_total.record(now - t_detect)
+        self._drawn = keep
+
+    def discard(self):
+        # the events didn't change anything on screen: no photon to wait for
+        self._dequeued.clear()
+
+    def reset(self):
+        for h in self.hist.values():
+            h.reset()
+
+    def report(self) -> str:
+        lines = ["input latency:"]
+        for stage in self.STAGES:
+            lines.append(f"  {stage:<15} {self.hist[stage].summary_ms()}")
+        return "\n".join(lines)
@@ -0,0 +1,119 @@
+"""
+Prometheus text exposition over a tiny localhost HTTP server.
+
+    exporter = MetricsServer(collect, port=9108)   # collect() -> Exposition
+    exporter.start()
+    curl http://127.0.0.1:9108/metrics
+
+Everything is formatted on the server thread when scraped; the main loop
+only keeps its histograms and counters up to date. Values are read without
+locking, so a scrape racing a frame can be off by one sample.
+"""
+import logging
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+log = logging.getLogger(__name__)
+
+
+def _labels(labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{v}"' for k, v in labels.items()) + "}"
+
+
+class Exposition:
+    """Builds one scrape's worth of metrics in the text format."""
+
+    def __init__(self, prefix: str = "led_"):
+        self.prefix = prefix
+        self._lines = []
+        self._seen = set()
+
+    def _header(self, name, kind, help_text):
+        if name not in self._seen:
+            self._seen.add(name)
+            self._lines.append(f"# HELP {name} {help_text}")
+            self._lines.append(f"# TYPE {name} {kind}")
+
+    def counter(self, name, value, help_text, labels=None):
+        name = self.prefix + name
+        self._header(name, "counter", help_text)
+        self._lines.append(f"{name}{_labels(labels)} {value}")
+
+    def gauge(self, name, value, help_text, labels=None):
+        name = self.prefix + name
+        self._header(name, "gauge", help_text)
+        self._lines.append(f"{name}{_labels(labels)} {value}")
+
+    def histogram(self, name, hist, help_text, labels=None):
+        """`hist` is a metrics.Histogram (seconds)."""
+        name = self.prefix + name
+        self._header(name, "histogram", help_text)
+        labels = dict(labels or {})
+        counts = list(hist.counts)
+        cum = 0
+        for bound, c in zip(hist.bounds, counts):
+            cum += c
+            self._lines.append(f"{name}_bucket{_labels({**labels, 'le': f'{bound:.6g}'})} {cum}")
+        cum += counts[-1]
+        self._lines.append(f"{name}_bucket{_labels({**labels, 'le': '+Inf'})} {cum}")
+        self._lines.append(f"{name}_sum{_labels(labels)} {hist.sum:.9f}")
+        self._lines.append(f"{name}_count{_labels(labels)} {cum}")
+
+    def text(self) -> str:
+        return "\n".join(self._lines) + "\n"
+
+
+def rss_bytes() -> int:
+    """Resident set size of this process (0 if unknown)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+class MetricsServer:
+    """Serves collect().text() at /metrics on host:port, on a daemon thread."""
+
+    def __init__(self, collect, *, host: str = "127.0.0.1", port: int = 9108):
+        self.collect = collect
+        self.host = host
+        self.port = port
+        self._httpd = None
+
+    def start(self):
+        collect = self.collect
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                try:
+                    body = collect().text().encode()
+                except Exception:
+                    log.exception("collecting metrics failed")
+                    self.send_error(500)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, fmt, *args):
+                log.debug("metrics: " + fmt, *args)
+
+        self._httpd = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._httpd.daemon_threads = True
+        threading.Thread(target=self._httpd.serve_forever, name="metrics-http", daemon=True).start()
+        log.info("metrics on http://%s:%d/metrics", self.host, self._httpd.server_address[1])
+
+    def stop(self):
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
@@ -3,3 +3,6 @@ from .text import TextScreen
 from .image import ImageScreen
 from .countdown import CountdownScreen
 from .stopwatch import StopwatchScreen
+from .animation import AnimationScreen
+from .stream import StreamScreen
+from .tiles import TiledScreen
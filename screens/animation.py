@@ -0,0 +1,69 @@
+from display import ArrayCanvas
+from assets.framefile import FrameFile
+from input.events import Event, SHORT_CLICK, LONG_CLICK
+from .base import Screen
+
+
+class AnimationScreen(Screen):
+    """
+    Plays a .ledf frame file (see assets/framefile.py) straight out of mmap.
+    Each frame keeps its own delay.
+
+    SHORT_CLICK: pause / resume
+    LONG_CLICK:  restart from the first frame
+    """
+    name = "Animation"
+
+    def __init__(self, path, *, speed: float = 1.0, position=(0, 0)):
+        self.clip = FrameFile(path)
+        if len(self.clip) == 0:
+            raise ValueError(f"Animation has no frames: {path}")
+        self.speed = speed
+        self.x, self.y = position
+
+        self.i = 0
+        self.t = 0.0
+        self.playing = True
+
+    def close(self):
+        self.clip.close()  # unmaps the file and closes its fd
+
+    def frame_rate(self) -> float:
+        if not self.playing:
+            return 0.0
+        return self.speed / self.clip.delays[self.i]
+
+    def handle(self, event: Event) -> bool:
+        et = event.kind
+
+        if et == SHORT_CLICK:
+            self.playing = not self.playing
+            return True
+
+        if et == LONG_CLICK:
+            self.i = 0
+            self.t = 0.0
+            self.invalidate()
+            return True
+
+        return False
+
+    def update(self, dt: float):
+        if not self.playing:
+            return
+        self.t += dt * self.speed
+        delays = self.clip.delays
+        while self.t >= delays[self.i]:
+            self.t -= delays[self.i]
+            self.i = (self.i + 1) % len(delays)
+            self.invalidate()
+
+    def draw(self, canvas):
+        if self.clip.size != (canvas.width, canvas.height) or (self.x, self.y) != (0, 0):
+            canvas.Clear()
+
+        # array canvases take the mmap view directly; rgbmatrix needs PIL
+        if isinstance(canvas, ArrayCanvas):
+            canvas.SetImage(self.clip.array(self.i), self.x, self.y)
+        else:
+            canvas.SetImage(self.clip.image(self.i), self.x, self.y)
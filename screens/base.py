@@ -1,13 +1,82 @@
+from PIL import Image
+
+from display import ArrayCanvas
+from input.events import Event
+
+
+class Layer:
+    """
+    One piece of a screen's picture, painted by `paint(canvas)`.
+
+    Static layers (labels, frames, backgrounds) are painted once into the
+    screen's cached background and reused until invalidate() is called on
+    them. Dynamic layers are painted on top of it every frame.
+    """
+
+    __slots__ = ("screen", "paint", "static", "visible")
+
+    def __init__(self, screen, paint, *, static=False, visible=True):
+        self.screen = screen
+        self.paint = paint
+        self.static = static
+        self.visible = visible
+
+    def invalidate(self):
+        """What paint() draws changed."""
+        if self.static:
+            self.screen._background = None
+        self.screen.invalidate()
+
+    def show(self, visible: bool = True):
+        if visible != self.visible:
+            self.visible = visible
+            self.invalidate()
+
+
 class Screen:
     name = "Unnamed"
 
+    # Redraw protocol: a screen only gets drawn when `dirty` is set.
+    # update()/handle() call invalidate() whenever what draw() would
+    # produce has changed; ScreenManager clears the flag once drawn.
+    dirty = True
+
+    # Frames per second this screen needs while nothing is happening.
+    # 0 means "only redraw on input"; FrameScheduler clamps it to its range.
+    fps = 60.0
+
+    # Optional layer model, see add_layer(). Screens that override draw()
+    # themselves don't need it.
+    layers = ()
+    _background = None  # (ArrayCanvas, PIL image or None if empty) of the static layers
+
+    def invalidate(self):
+        """
+        Mark the screen as needing a redraw on the next frame.
+        """
+        self.dirty = True
+
+    def frame_rate(self) -> float:
+        """
+        Frame rate the scheduler should run at right now. Override when it
+        depends on state (e.g. an animation that only runs in one mode).
+        """
+        return self.fps
+
     def on_enter(self):
         pass
 
     def on_exit(self):
         pass
 
-    def handle(self, event: dict) -> bool:
+    def close(self):
+        """
+        Release what the screen holds open (files, mappings, threads) when
+        it's discarded. ScreenManager.close() calls it for every built screen.
+        """
+        pass
+
+    def handle(self, event: Event) -> bool:
         """
         Return True if the screen consumed the event.
         """
@@ -19,8 +88,46 @@ class Screen:
         """
         pass
 
+    def add_layer(self, paint, *, static=False, visible=True) -> Layer:
+        """
+        Add a layer on top of the existing ones. With layers, the default
+        draw() blits the cached static layers and paints the dynamic ones,
+        so a frame costs one blit plus whatever actually moves. Static
+        layers always end up below dynamic ones.
+        """
+        if not self.layers:
+            self.layers = []
+        layer = Layer(self, paint, static=static, visible=visible)
+        self.layers.append(layer)
+        if static:
+            self._background = None
+        self.invalidate()
+        return layer
+
+    def _render_background(self, width, height):
+        static = [layer for layer in self.layers if layer.static and layer.visible]
+        bg = ArrayCanvas(width, height)
+        for layer in static:
+            layer.paint(bg)
+        self._background = (bg, Image.fromarray(bg.array) if static else None)
+
+    def compose(self, canvas):
+        bg = self._background
+        if bg is None or bg[0].width != canvas.width or bg[0].height != canvas.height:
+            self._render_background(canvas.width, canvas.height)
+            bg = self._background
+        if bg[1] is None:
+            canvas.Clear()  # nothing static showing
+        else:
+            # the background covers the whole canvas, so no Clear() needed
+            canvas.SetImage(bg[0].array if isinstance(canvas, ArrayCanvas) else bg[1], 0, 0)
+        for layer in self.layers:
+            if not layer.static and layer.visible:
+                layer.paint(canvas)
+
     def draw(self, canvas):
         """
         Draw current state onto canvas.
         """
-        pass
+        if self.layers:
+            self.compose(canvas)
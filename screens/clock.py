@@ -1,33 +1,35 @@
-import datetime
-import zoneinfo
-from rgbmatrix import graphics
+from display import graphics, get_font, draw_text
+from timing import time_service
 from .base import Screen
 
 
 class ClockScreen(Screen):
     name = "Clock"
+    fps = 0.0  # redrawn by the time service on each second, nothing in between
 
     def __init__(self, font_path: str):
-        self.font = graphics.Font()
-        self.font.LoadFont(font_path)
-        self.tz = zoneinfo.ZoneInfo("America/Chicago")
+        self.font = get_font(font_path)
         self.color = graphics.Color(255, 255, 255)
-
-        # Optional: update string once per second (reduces work)
-        self._accum = 0.0
         self._cached = ""
 
     def on_enter(self):
-        self._accum = 999.0  # force refresh
+        self._refresh()
+        time_service.on_second(self._on_second)
+
+    def on_exit(self):
+        time_service.unsubscribe(self._on_second)
+
+    def _on_second(self, second: int):
+        self._refresh()
 
-    def update(self, dt: float):
-        self._accum += dt
-        if self._accum >= 0.2:  # refresh 5x/sec so seconds tick feels snappy
-            self._accum = 0.0
-            now = datetime.datetime.now(self.tz)
-            self._cached = now.strftime("%H:%M:%S")
+    def _refresh(self):
+        # local() is shared: one timezone conversion per second for everyone
+        text = time_service.local().strftime("%H:%M:%S")
+        if text != self._cached:
+            self._cached = text
+            self.invalidate()
 
     def draw(self, canvas):
         canvas.Clear()
         # y is baseline; tune as you like for your font
-        graphics.DrawText(canvas, self.font, 2, 12, self.color, self._cached)
+        draw_text(canvas, self.font, 2, 12, self.color, self._cached)
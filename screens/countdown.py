@@ -1,46 +1,65 @@
 # screens/countdown.py
-from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
-from rgbmatrix import graphics
+from display import graphics, get_font, draw_text
+from timing import time_service
 from .base import Screen
 
 
 class CountdownScreen(Screen):
     name = "Countdown"
+    fps = 0.0  # the time service wakes us on every second
 
     def __init__(self, font_path: str):
-        self.tz = ZoneInfo("America/Chicago")  # CST/CDT handled automatically
-        self.font = graphics.Font()
-        self.font.LoadFont(font_path)
+        self.font = get_font(font_path)
 
         self.color = graphics.Color(0, 255, 255)  # cyan
-        self._accum = 0.0
         self._text = ""
+        # next local midnight (CST/CDT handled by the time service); the
+        # timezone math runs once a day, from a timer, instead of once a second
+        self._midnight = time_service.next_midnight()
+        self._midnight_timer = None
 
+        # the label never changes: painted once into the cached background
+        self.add_layer(self._draw_label, static=True)
+        self.add_layer(self._draw_time)
+
+        self._recompute_text()
+
+    def on_enter(self):
+        if time_service.second >= self._midnight:
+            self._midnight = time_service.next_midnight()  # we were off screen at midnight
+        self._recompute_text()
+        time_service.on_second(self._on_second)
+        self._midnight_timer = time_service.call_at(self._midnight, self._on_midnight)
+
+    def on_exit(self):
+        time_service.unsubscribe(self._on_second)
+        if self._midnight_timer is not None:
+            self._midnight_timer.cancel()
+            self._midnight_timer = None
+
+    def _on_second(self, second: int):
+        self._recompute_text()
+
+    def _on_midnight(self):
+        self._midnight = time_service.next_midnight()
+        self._midnight_timer = time_service.call_at(self._midnight, self._on_midnight)
         self._recompute_text()
 
     def _recompute_text(self):
-        now = datetime.now(self.tz)
-        tomorrow = (now + timedelta(days=1)).date()
-        midnight = datetime(tomorrow.year, tomorrow.month, tomorrow.day, 0, 0, 0, tzinfo=self.tz)
-        remaining = int((midnight - now).total_seconds())
-        if remaining < 0:
-            remaining = 0
+        second = time_service.second
+        remaining = max(0, int(self._midnight - second) - 1)
 
         # Format as HH:MM:SS + total seconds
         h = remaining // 3600
         m = (remaining % 3600) // 60
         s = remaining % 60
-        self._text = f"{h:02d}:{m:02d}:{s:02d}  ({remaining})"
-
-    def update(self, dt: float):
-        # Update once per second (not every frame)
-        self._accum += dt
-        if self._accum >= 1.0:
-            self._accum %= 1.0
-            self._recompute_text()
-
-    def draw(self, canvas):
-        canvas.Clear()
-        graphics.DrawText(canvas, self.font, 1, 12, self.color, "Seconds left today:")
-        graphics.DrawText(canvas, self.font, 1, 26, self.color, self._text)
+        text = f"{h:02d}:{m:02d}:{s:02d}  ({remaining})"
+        if text != self._text:
+            self._text = text
+            self.invalidate()
+
+    def _draw_label(self, canvas):
+        draw_text(canvas, self.font, 1, 12, self.color, "Seconds left today:")
+
+    def _draw_time(self, canvas):
+        draw_text(canvas, self.font, 1, 26, self.color, self._text)
@@ -1,16 +1,21 @@
-from rgbmatrix import graphics
-from PIL import Image, ImageOps
+from PIL import Image
+from assets import assets, effects
+from input.events import Event, ROTATE, SHORT_CLICK, LONG_CLICK
 from .base import Screen
 
 
 class ImageScreen(Screen):
     name = "Image"
+    fps = 0.0  # only changes on input
 
-    def __init__(self, image_paths, size=(64, 32), nearest=True):
+    def __init__(self, image_paths, size=None, nearest=True, effect_list=None):
         """
         image_paths: list[str] or a single str
-        size: (width, height) expected by your panel, e.g. (64, 32)
+        size: (width, height) to fit images to, e.g. (64, 32); None fits
+              them to whatever region the screen is drawn into
         nearest: True uses pixel-art friendly scaling
+        effect_list: effects LONG_CLICK cycles through (after "none"),
+                     e.g. [effects.invert(), effects.brightness(0.3)]
         """
         if isinstance(image_paths, str):
             image_paths = [image_paths]
@@ -20,47 +25,47 @@ class ImageScreen(Screen):
         self.nearest = nearest
 
         self.index = 0
-        self.invert = False  # optional effect
-        self._cache = {}     # cache loaded/resized images
+        self.effects = list(effect_list) if effect_list is not None else [effects.invert()]
+        self.effect_i = -1   # -1 = no effect
         self.edit_mode = False
-        # Optional text overlay (if you want)
-        self.font = graphics.Font()
-        # load a font only if you want overlay text:
-        # self.font.LoadFont("/home/admin/rpi-rgb-led-matrix/fonts/6x10.bdf")
+        self._shown = None   # image for (index, effect), resolved on first draw
+        # Optional text overlay (if you want):
+        # self.font = get_font("/home/admin/rpi-rgb-led-matrix/fonts/6x10.bdf")
 
-    def _load_image(self, path: str) -> Image.Image:
-        """Load + resize + convert to RGB. Cached."""
-        key = (path, self.size, self.nearest)
-        if key in self._cache:
-            return self._cache[key]
+    @property
+    def effect(self):
+        return self.effects[self.effect_i] if self.effect_i >= 0 else None
 
-        img = Image.open(path).convert("RGB")
-        resample = Image.NEAREST if self.nearest else Image.BICUBIC
-        img = img.resize(self.size, resample=resample)
+    def _load_image(self, path: str, size, effect=None) -> Image.Image:
+        """Load + resize + convert to RGB (+ effect variant). Cached."""
+        return assets.get(path, size, "fit", effect=effect, nearest=self.nearest)
 
-        self._cache[key] = img
-        return img
+    def invalidate(self):
+        self._shown = None
+        super().invalidate()
 
-    def handle(self, event: dict) -> bool:
-        et = event.get("type")
+    def handle(self, event: Event) -> bool:
+        et = event.kind
 
         # Toggle edit mode
-        if et == "SHORT_CLICK":
+        if et == SHORT_CLICK:
             self.edit_mode = not self.edit_mode
+            self.invalidate()
             return True
 
-        # Long click could invert, reset, etc.
-        if et == "LONG_CLICK":
-            self.invert = not self.invert
+        # Long click cycles effects: none -> effects[0] -> ... -> none
+        if et == LONG_CLICK:
+            self.effect_i += 1
+            if self.effect_i >= len(self.effects):
+                self.effect_i = -1
+            self.invalidate()
             return True
 
         # Only consume ROTATE when in edit mode
-        if et == "ROTATE" and self.edit_mode:
-            d = event.get("delta", 0)
-            if d > 0:
-                self.index = (self.index + 1) % len(self.image_paths)
-            elif d < 0:
-                self.index = (self.index - 1) % len(self.image_paths)
+        if et == ROTATE and self.edit_mode:
+            d = event.delta
+            self.index = (self.index + d) % len(self.image_paths)
+            self.invalidate()
             return True
 
         # Otherwise, do NOT handle rotate — let manager switch screens
@@ -70,17 +75,13 @@ class ImageScreen(Screen):
     def draw(self, canvas):
         canvas.Clear()
 
-        path = self.image_paths[self.index]
-        img = self._load_image(path)
-
-        if self.invert:
-            img_to_show = ImageOps.invert(img)
-        else:
-            img_to_show = img
+        size = self.size or (canvas.width, canvas.height)
+        if self._shown is None or self._shown.size != tuple(size):
+            self._shown = self._load_image(self.image_paths[self.index], size, self.effect)
 
         # Draw full image at (0,0)
-        canvas.SetImage(img_to_show, 0, 0)
+        canvas.SetImage(self._shown, 0, 0)
 
         # Optional overlay text:
         # white = graphics.Color(255, 255, 255)
-        # graphics.DrawText(canvas, self.font, 1, 31, white, f"{self.index+1}/{len(self.image_paths)}")
+        # draw_text(canvas, self.font, 1, 31, white, f"{self.index+1}/{len(self.image_paths)}")
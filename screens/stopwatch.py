@@ -2,9 +2,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from PIL import Image
-from rgbmatrix import graphics
-from PIL import Image, ImageOps
+from display import graphics, get_font, draw_text
+from assets import assets
+from input.events import Event, SHORT_CLICK, LONG_CLICK
 from .base import Screen
 
 
@@ -25,64 +25,58 @@ class StopwatchScreen(Screen):
         font_path: str,
         images_dir: str | Path,
         *,
-        width: int = 64,
-        height: int = 32,
+        width: int | None = None,        # animation frame size; None = whatever
+        height: int | None = None,       # region the screen is drawn into
         anim_fps: float = 12.0,          # animation speed
         display_fps: float = 30.0,       # how often we update the displayed time text
     ):
         self.w = width
         self.h = height
 
-        self.font = graphics.Font()
-        self.font.LoadFont(font_path)
+        self.font = get_font(font_path)
 
         self.color = graphics.Color(0, 255, 255)   # cyan
         self.color2 = graphics.Color(255, 255, 255)
 
         self.images_dir = Path(images_dir)
-        self.frames = self._load_frames(self.images_dir, self.w, self.h)
+        self.frame_paths = self._find_frames(self.images_dir)
+        self._frames = {}  # (w, h) -> frames
+        if self.w and self.h:
+            self._frames_for(self.w, self.h)
 
-        self.anim_dt = 1.0 / max(anim_fps, 1.0)
-        self.display_dt = 1.0 / max(display_fps, 1.0)
+        self.anim_fps = max(anim_fps, 1.0)
+        self.display_fps = max(display_fps, 1.0)
+        self.anim_dt = 1.0 / self.anim_fps
+        self.display_dt = 1.0 / self.display_fps
 
         self.s = StopwatchState()
 
         # cached render text (so we don't format every frame)
         self._time_text = "00:00.000"
 
-    def _load_frames(self, images_dir: Path, w: int, h: int):
-        frames = []
+        # idle: the animation; otherwise the RUN/PAUSE label (static, only
+        # repainted when the mode changes) and the time
+        self._anim_layer = self.add_layer(self._draw_frame)
+        self._label_layer = self.add_layer(self._draw_label, static=True, visible=False)
+        self._time_layer = self.add_layer(self._draw_time, visible=False)
+
+    def _find_frames(self, images_dir: Path):
+        paths = []
         for i in range(8):
             p = images_dir / f"stopwatch{i}.png"
             if not p.exists():
                 raise FileNotFoundError(f"Missing animation frame: {p}")
-
-            src = Image.open(p).convert("RGBA")
-
-            # Use alpha as mask -> white foreground on black background
-            alpha = src.split()[3]  # A channel
-
-            # Make a white icon image the same size as src, masked by alpha
-            icon = Image.new("RGB", src.size, (0, 0, 0))
-            white = Image.new("RGB", src.size, (255, 255, 255))
-            icon.paste(white, (0, 0), alpha)
-
-            # Scale up (nearest keeps pixel-art crisp)
-            # Choose a scale that fits inside 64x32 nicely
-            # Example: target height 28px
-            target_h = 25
-            scale = max(1, target_h // src.size[1])
-            new_w, new_h = src.size[0] * scale, src.size[1] * scale
-            icon = icon.resize((new_w, new_h), Image.NEAREST)
-
-            # Center on a 64x32 black frame
-            frame = Image.new("RGB", (w, h), (0, 0, 0))
-            x = (w - new_w) // 2
-            y = (h - new_h) // 2
-            frame.paste(icon, (x, y))
-
-            frames.append(frame)
-
+            paths.append(p)
+        return paths
+
+    def _frames_for(self, w: int, h: int):
+        frames = self._frames.get((w, h))
+        if frames is None:
+            # alpha as mask -> white icon on black, scaled up (nearest keeps
+            # pixel-art crisp) and centered on a w x h frame; the result is
+            # cached on disk so later boots skip all of this
+            frames = [assets.get(p, (w, h), "alpha_icon", target_h=25) for p in self.frame_paths]
+            self._frames[(w, h)] = frames
         return frames
 
 
@@ -97,29 +91,47 @@ class StopwatchScreen(Screen):
         minutes = (total_s // 60) % 100  # clamp display to 0..99 minutes
         return f"{minutes:02d}:{sec:02d}.{ms:03d}"
 
-    def handle(self, event: dict) -> bool:
-        et = event.get("type")
+    def frame_rate(self) -> float:
+        if self.s.mode == "idle":
+            return self.anim_fps
+        if self.s.mode == "running":
+            return self.display_fps
+        return 0.0  # paused: nothing moves until the next click
+
+    def _mode_changed(self):
+        idle = self.s.mode == "idle"
+        self._anim_layer.show(idle)
+        self._label_layer.show(not idle)
+        self._time_layer.show(not idle)
+        self._label_layer.invalidate()  # RUN <-> PAUSE
 
-        if et == "LONG_CLICK":
+    def handle(self, event: Event) -> bool:
+        et = event.kind
+
+        if et == LONG_CLICK:
             # reset to animation
             self.s = StopwatchState(mode="idle")
             self._time_text = "00:00.000"
+            self._mode_changed()
             return True
 
-        if et == "SHORT_CLICK":
+        if et == SHORT_CLICK:
             if self.s.mode == "idle":
                 # start stopwatch from 0
                 self.s.mode = "running"
                 self.s.elapsed_s = 0.0
                 self._time_text = "00:00.000"
+                self._mode_changed()
                 return True
 
             if self.s.mode == "running":
                 self.s.mode = "paused"
+                self._mode_changed()
                 return True
 
             if self.s.mode == "paused":
                 self.s.mode = "running"
+                self._mode_changed()
                 return True
 
         return False
@@ -130,7 +142,8 @@ class StopwatchScreen(Screen):
             self.s.anim_t += dt
             while self.s.anim_t >= self.anim_dt:
                 self.s.anim_t -= self.anim_dt
-                self.s.anim_i = (self.s.anim_i + 1) % len(self.frames)
+                self.s.anim_i = (self.s.anim_i + 1) % len(self.frame_paths)
+                self.invalidate()
             return
 
         # ---------- stopwatch ----------
@@ -141,18 +154,18 @@ class StopwatchScreen(Screen):
         self.s.tick_t += dt
         if self.s.tick_t >= self.display_dt:
             self.s.tick_t %= self.display_dt
-            self._time_text = self._format_time(self.s.elapsed_s)
+            text = self._format_time(self.s.elapsed_s)
+            if text != self._time_text:
+                self._time_text = text
+                self.invalidate()
 
-    def draw(self, canvas):
-        canvas.Clear()
+    def _draw_frame(self, canvas):
+        frames = self._frames_for(self.w or canvas.width, self.h or canvas.height)
+        canvas.SetImage(frames[self.s.anim_i], 0, 0)
 
-        if self.s.mode == "idle":
-            # draw animation frame
-            canvas.SetImage(self.frames[self.s.anim_i], 0, 0)
-            return
+    def _draw_label(self, canvas):
+        draw_text(canvas, self.font, 1, 10, self.color2,
+                  "RUN" if self.s.mode == "running" else "PAUSE")
 
-        # stopwatch display
-        # Optional small label
-        graphics.DrawText(canvas, self.font, 1, 10, self.color2,
-                          "RUN" if self.s.mode == "running" else "PAUSE")
-        graphics.DrawText(canvas, self.font, 1, 26, self.color, self._time_text)
+    def _draw_time(self, canvas):
+        draw_text(canvas, self.font, 1, 26, self.color, self._time_text)
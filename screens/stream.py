@@ -0,0 +1,105 @@
+from functools import partial
+
+from assets import sources
+from assets.prefetch import Prefetcher
+from input.events import Event, SHORT_CLICK
+from .base import Screen
+
+
+class StreamScreen(Screen):
+    """
+    Plays an animation decoded on the fly (GIF, sprite sheet, any frame
+    source), with a small prefetch buffer filled by a background thread.
+    Only `prefetch` frames are ever decoded ahead, and the decoder only runs
+    while the screen is showing.
+
+    If the decoder falls behind, the current frame stays up a little longer
+    instead of the render loop waiting for it.
+
+    SHORT_CLICK: pause / resume
+    """
+    name = "Stream"
+
+    def __init__(self, source, size=None, *, prefetch: int = 4, nearest: bool = True):
+        """
+        source: zero-argument callable returning an iterator of (PIL image, delay_s),
+                see assets/sources.py (or use StreamScreen.gif / .sprite_sheet)
+        size: (width, height) to fit frames to; None fits them to whatever
+              region the screen is drawn into
+        """
+        self.size = tuple(size) if size is not None else None
+        self.nearest = nearest
+        # what the decoder fits frames to; with size=None it's learned on the first draw
+        self._fit = self.size
+        self._showing = False
+        self.prefetcher = Prefetcher(lambda: sources.fitted(source(), self._fit, nearest=nearest), prefetch)
+
+        self.frame = None
+        self.delay = 0.1
+        self.t = 0.0
+        self.playing = True
+
+    @classmethod
+    def gif(cls, path, size=None, **kw):
+        return cls(partial(sources.gif_frames, path), size, **kw)
+
+    @classmethod
+    def sprite_sheet(cls, path, frame_size, fps: float, size=None, *, count=None, **kw):
+        return cls(partial(sources.sprite_frames, path, frame_size, 1.0 / fps, count=count), size, **kw)
+
+    def on_enter(self):
+        self._showing = True
+        if self._fit is not None:
+            self.prefetcher.start()
+
+    def on_exit(self):
+        self._showing = False
+        self.prefetcher.stop()
+        self.frame = None
+
+    def close(self):
+        self.prefetcher.stop()
+
+    def frame_rate(self) -> float:
+        if not self.playing:
+            return 0.0
+        return 1.0 / self.delay
+
+    def handle(self, event: Event) -> bool:
+        if event.kind == SHORT_CLICK:
+            self.playing = not self.playing
+            return True
+        return False
+
+    def update(self, dt: float):
+        if not self.playing:
+            return
+        self.t += dt
+        if self.frame is not None and self.t < self.delay:
+            return
+
+        item = self.prefetcher.get()
+        if item is None:
+            return  # decoder behind: keep showing the current frame
+
+        # carry over the overshoot (capped) so the clip keeps its tempo
+        self.t = min(self.t - self.delay, self.delay) if self.frame is not None else 0.0
+        self.frame, self.delay = item
+        self.invalidate()
+
+    def _refit(self, size):
+        # first draw, or drawn into a region of another size: decode at the new size
+        self._fit = size
+        if self._showing:
+            self.prefetcher.stop()
+            self.prefetcher.start()
+        if self.frame is not None:
+            self.frame, _ = next(sources.fitted([(self.frame, self.delay)], size, nearest=self.nearest))
+
+    def draw(self, canvas):
+        canvas.Clear()
+        size = self.size or (canvas.width, canvas.height)
+        if size != self._fit:
+            self._refit(size)
+        if self.frame is not None:
+            canvas.SetImage(self.frame, 0, 0)
@@ -1,14 +1,33 @@
-from rgbmatrix import graphics
+import numpy as np
+from PIL import Image
+
+from display import ArrayCanvas, graphics, get_font, draw_text, text_cache
+from input.events import Event, ROTATE, SHORT_CLICK, LONG_CLICK
 from .base import Screen
 
 
 class TextScreen(Screen):
     name = "Text"
+    fps = 0.0  # static until a click changes the color
 
-    def __init__(self, font_path: str, message: str):
-        self.font = graphics.Font()
-        self.font.LoadFont(font_path)
-        self.message = message
+    def __init__(self, font_path: str, message, *, marquee=None, speed: float = 20.0,
+                 gap: int = 16, subpixel: bool = True):
+        """
+        message: a string, or a list of strings shown one after another
+        marquee: scroll the text; None = only when it doesn't fit (or for a list)
+        speed: scroll speed in pixels per second
+        gap: blank pixels between messages
+        subpixel: blend neighbouring pixels for positions between whole pixels
+        """
+        self.font = get_font(font_path)
+        self.messages = [message] if isinstance(message, str) else list(message)
+        if not self.messages:
+            raise ValueError("TextScreen needs at least one message")
+        self.message = self.messages[0]
+        self.marquee = marquee
+        self.speed = speed
+        self.gap = gap
+        self.subpixel = subpixel
 
         self.palette = [
             graphics.Color(255, 255, 255),  # white
@@ -24,18 +43,87 @@ class TextScreen(Screen):
         # Optional: an edit mode (not required). If you want rotate to adjust color ONLY in edit mode.
         self.edit_mode = False
 
-    def handle(self, event: dict) -> bool:
-        et = event.get("type")
+        # marquee: every message rendered once into a strip (+ one screen
+        # width of wrap-around), then each frame blits a window of it
+        self._strip = None      # (h, length + width + 1, 3) uint8
+        self._strip_key = None  # (color_i, width) the strip was built for
+        self._length = 0        # one full cycle of messages + gaps, px
+        self._scrolling = False
+        self._pos = 0.0         # px into the strip
+        self._out = None        # blend scratch
+        self._tmp = None
+
+    def frame_rate(self) -> float:
+        if not self._scrolling:
+            return 0.0
+        # whole-pixel steps only need `speed` frames a second
+        return 60.0 if self.subpixel else self.speed
+
+    def _build_strip(self, width: int):
+        color = self.palette[self.color_i]
+        bitmaps = [text_cache.render(self.font, m, color) for m in self.messages]
+        self._strip_key = (self.color_i, width)
+        length = sum(tb.advance + self.gap for tb in bitmaps)
+        fits = len(bitmaps) == 1 and bitmaps[0].array.shape[1] <= width - 2
+        self._scrolling = (not fits) if self.marquee is None else bool(self.marquee)
+        if length == 0:
+            self._scrolling = False  # empty text and no gap: nothing to scroll
+        if not self._scrolling:
+            self._strip = None
+            return
+
+        h = self.font.height
+        strip = np.zeros((h, length + max(tb.array.shape[1] for tb in bitmaps), 3), dtype=np.uint8)
+        x = 0
+        for tb in bitmaps:
+            region = strip[:, x:x + tb.array.shape[1]]
+            np.maximum(region, tb.array, out=region)
+            x += tb.advance + self.gap
+        # fold glyph overhang past the end back to the start, then tile so
+        # any window [pos, pos + width + 1) is one contiguous slice
+        strip[:, :strip.shape[1] - length] |= strip[:, length:]
+        self._strip = strip[:, np.arange(length + width + 1) % length]
+        self._length = length
+        self._pos %= length
+        self._out = np.empty((h, width, 3), dtype=np.uint8)
+        self._tmp = (np.empty((h, width, 3), dtype=np.uint16), np.empty((h, width, 3), dtype=np.uint16))
+
+    def update(self, dt: float):
+        if not self._scrolling:
+            return
+        old = self._pos
+        self._pos = (self._pos + dt * self.speed) % self._length
+        if self.subpixel or int(old) != int(self._pos):
+            self.invalidate()
+
+    def _window(self, width: int):
+        i = int(self._pos)
+        frac = int((self._pos - i) * 256)
+        if not self.subpixel or frac == 0:
+            return self._strip[:, i:i + width]
+        # screen x shows strip x + pos: mix strip[x + i] and strip[x + i + 1]
+        ta, tb = self._tmp
+        np.multiply(self._strip[:, i:i + width], 256 - frac, out=ta, dtype=np.uint16)
+        np.multiply(self._strip[:, i + 1:i + 1 + width], frac, out=tb, dtype=np.uint16)
+        ta += tb
+        ta >>= 8
+        np.copyto(self._out, ta, casting="unsafe")
+        return self._out
+
+    def handle(self, event: Event) -> bool:
+        et = event.kind
 
         # Short click: change color once (your request)
-        if et == "SHORT_CLICK":
+        if et == SHORT_CLICK:
             self.color_i = (self.color_i + 1) % len(self.palette)
+            self.invalidate()
             return True
 
         # Long click: reset color (or toggle edit mode if you prefer)
-        if et == "LONG_CLICK":
+        if et == LONG_CLICK:
             # Option A: reset
             self.color_i = 0
+            self.invalidate()
             return True
 
             # Option B (instead): toggle edit mode
@@ -43,17 +131,27 @@ class TextScreen(Screen):
             # return True
 
         # If you want rotation to change color only when in edit mode, enable this:
-        if self.edit_mode and et == "ROTATE":
-            d = event.get("delta", 0)
-            self.color_i = (self.color_i + (1 if d > 0 else -1)) % len(self.palette)
+        if self.edit_mode and et == ROTATE:
+            d = event.delta
+            self.color_i = (self.color_i + d) % len(self.palette)
+            self.invalidate()
             return True
 
         return False
 
     def draw(self, canvas):
         canvas.Clear()
-        color = self.palette[self.color_i]
-        graphics.DrawText(canvas, self.font, 2, 12, color, self.message)
+        if self._strip_key != (self.color_i, canvas.width):
+            self._build_strip(canvas.width)
+
+        if self._scrolling:
+            # cost depends on the panel width, not on how long the text is
+            window = self._window(canvas.width)
+            top = 12 - self.font.baseline
+            canvas.SetImage(window if isinstance(canvas, ArrayCanvas) else Image.fromarray(window), 0, top)
+        else:
+            color = self.palette[self.color_i]
+            draw_text(canvas, self.font, 2, 12, color, self.message)
 
         # If edit_mode is enabled, draw a small marker (optional)
         if self.edit_mode:
@@ -0,0 +1,78 @@
+from display import viewport
+from input.events import Event
+from .base import Screen
+
+
+class TiledScreen(Screen):
+    """
+    Several screens side by side on one big panel (e.g. two 64x32 screens
+    on a 128x32 chain, four on 128x64). Each screen draws into its own
+    region as if it were a whole panel.
+
+    Only tiles that are dirty get redrawn, as long as the canvas keeps its
+    pixels between frames (the software frame of RenderPipeline(diff=...)
+    does); any other canvas gets every tile.
+
+    Input goes to the `focus` tile; whatever it doesn't consume falls
+    through to the ScreenManager as usual.
+    """
+
+    name = "Tiles"
+
+    def __init__(self, tiles, *, focus: int = 0):
+        """
+        tiles: [(screen, (x, y, width, height)), ...]
+        """
+        self.tiles = list(tiles)
+        self.focus = focus
+        self._redraw_all = True
+        self._canvas = None  # canvas the tiles were last drawn into
+
+    @classmethod
+    def grid(cls, screens, *, tile=(64, 32), columns=2, **kw):
+        """Lay screens out row by row, `columns` tiles of `tile` size per row."""
+        w, h = tile
+        return cls([(s, ((i % columns) * w, (i // columns) * h, w, h)) for i, s in enumerate(screens)], **kw)
+
+    # dirty when any tile is, so ScreenManager.render() calls draw()
+    @property
+    def dirty(self):
+        return self._redraw_all or any(s.dirty for s, _ in self.tiles)
+
+    @dirty.setter
+    def dirty(self, value):
+        if value:
+            self._redraw_all = True
+
+    def frame_rate(self) -> float:
+        return max(s.frame_rate() for s, _ in self.tiles)
+
+    def on_enter(self):
+        for s, _ in self.tiles:
+            s.on_enter()
+
+    def on_exit(self):
+        for s, _ in self.tiles:
+            s.on_exit()
+
+    def close(self):
+        for s, _ in self.tiles:
+            s.close()
+
+    def handle(self, event: Event) -> bool:
+        return self.tiles[self.focus][0].handle(event)
+
+    def update(self, dt: float):
+        for s, _ in self.tiles:
+            s.update(dt)
+
+    def draw(self, canvas):
+        full = self._redraw_all or canvas is not self._canvas
+        self._redraw_all = False
+        self._canvas = canvas
+        if full:
+            canvas.Clear()
+        for s, rect in self.tiles:
+            if full or s.dirty:
+                s.dirty = False
+                s.draw(viewport(canvas, *rect))
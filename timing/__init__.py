@@ -0,0 +1,2 @@
+from .wheel import Timer, TimerWheel
+from .service import TimeService, time_service
@@ -0,0 +1,116 @@
+import datetime
+import logging
+import math
+import time
+import zoneinfo
+
+from .wheel import TimerWheel
+
+log = logging.getLogger(__name__)
+
+
+class TimeService:
+    """
+    One wall-clock reading per frame, shared by every screen.
+
+    The main loop calls tick() once per iteration. It reads time.time()
+    once, fires the on_second / on_minute callbacks when a boundary was
+    crossed, and runs timers that came due. Pass until_next() to
+    FrameScheduler.wait() so the loop wakes right on the next second or
+    timer instead of up to a frame late.
+
+    Screens subscribe in on_enter() and unsubscribe in on_exit(), so hidden
+    screens cost nothing. local() converts to the local timezone at most
+    once per second, however many screens ask.
+    """
+
+    def __init__(self, tz: str = "America/Chicago", *, clock=time.time):
+        self.tz = zoneinfo.ZoneInfo(tz)
+        self.clock = clock
+        self.now = clock()
+        self.second = int(self.now)
+        self._minute = self.second // 60
+        self._local = (None, None)  # (second, datetime), swapped in as one
+        self._on_second = []
+        self._on_minute = []
+        self.wheel = TimerWheel(self.now)
+
+    # ---------- per frame ----------
+
+    def tick(self) -> float:
+        self.now = now = self.clock()
+        second = int(now)
+        if second != self.second:
+            self.second = second
+            for cb in list(self._on_second):
+                self._call(cb, second)
+            minute = second // 60
+            if minute != self._minute:
+                self._minute = minute
+                for cb in list(self._on_minute):
+                    self._call(cb, second)
+        if self.wheel.pending:
+            self.wheel.advance(now)
+        return now
+
+    def _call(self, cb, *args):
+        try:
+            cb(*args)
+        except Exception:
+            log.exception("time callback %r failed", cb)
+
+    def until_next(self) -> float:
+        """Seconds until the next whole second or timer, whichever is first (fresh clock read)."""
+        now = self.clock()
+        wait = math.floor(now) + 1.0 - now
+        if self.wheel.pending:
+            fire = self.wheel.next_fire()
+            if fire is not None:
+                wait = min(wait, max(0.0, fire - now))
+        return wait
+
+    # ---------- subscriptions ----------
+
+    def on_second(self, cb):
+        """cb(epoch_second) at every second boundary."""
+        self._on_second.append(cb)
+
+    def on_minute(self, cb):
+        """cb(epoch_second) at every minute boundary."""
+        self._on_minute.append(cb)
+
+    def unsubscribe(self, cb):
+        for subs in (self._on_second, self._on_minute):
+            if cb in subs:
+                subs.remove(cb)
+
+    def call_at(self, when: float, cb):
+        """Run cb() once the wall clock reaches `when` (epoch seconds). Returns a Timer."""
+        return self.wheel.schedule(when, cb)
+
+    def call_later(self, delay: float, cb):
+        return self.wheel.schedule(self.now + delay, cb)
+
+    # ---------- shared conversions ----------
+
+    def local(self) -> datetime.datetime:
+        """
+        Current second in the local timezone (computed once per second).
+        Screens pre-warmed on another thread call this too, so the cache is
+        one tuple: readers never see a new second with an old datetime.
+        """
+        second = self.second
+        cached_second, local = self._local
+        if cached_second != second:
+            local = datetime.datetime.fromtimestamp(second, self.tz)
+            self._local = (second, local)
+        return local
+
+    def next_midnight(self) -> float:
+        """Epoch seconds of the next local midnight (DST-aware)."""
+        tomorrow = self.local().date() + datetime.timedelta(days=1)
+        midnight = datetime.datetime(tomorrow.year, tomorrow.month, tomorrow.day, tzinfo=self.tz)
+        return midnight.timestamp()
+
+
+time_service = TimeService()
@@ -0,0 +1,90 @@
+import math
+
+
+class Timer:
+    __slots__ = ("deadline", "callback", "cancelled")
+
+    def __init__(self, deadline: float, callback):
+        self.deadline = deadline
+        self.callback = callback
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class TimerWheel:
+    """
+    Hashed timer wheel: `slots` buckets of `resolution` seconds each. A timer
+    goes into the bucket its deadline falls in (modulo the wheel size), so
+    scheduling is O(1) and advance() only looks at the buckets the clock
+    moved past, not at every pending timer. Timers further out than one
+    revolution just stay put until a later pass finds them due. Timers fire
+    at most one resolution late.
+
+    Not thread-safe: schedule and advance from the main loop.
+    """
+
+    def __init__(self, now: float, *, resolution: float = 0.01, slots: int = 256):
+        self.resolution = resolution
+        self.slots = [[] for _ in range(slots)]
+        self._tick = int(now / resolution)  # last tick advance() processed
+        self.pending = 0
+
+    def schedule(self, deadline: float, callback) -> Timer:
+        timer = Timer(deadline, callback)
+        # first tick starting at/after the deadline: due whenever it's visited
+        tick = max(math.ceil(deadline / self.resolution), self._tick + 1)
+        self.slots[tick % len(self.slots)].append(timer)
+        self.pending += 1
+        return timer
+
+    def next_fire(self):
+        """
+        Earliest time advance() will fire something, or None. That's the
+        start of the first due tick, so it can be a little after the
+        deadline itself. Scans every bucket: call it once per loop, not
+        per timer.
+        """
+        best = None
+        for bucket in self.slots:
+            for timer in bucket:
+                if not timer.cancelled and (best is None or timer.deadline < best):
+                    best = timer.deadline
+        if best is None:
+            return None
+        tick = max(math.ceil(best / self.resolution), self._tick + 1)
+        # a hair past the tick so int(now / resolution) can't round below it
+        return tick * self.resolution + 1e-6
+
+    def advance(self, now: float):
+        """Fire every timer due by `now`, earliest first. Returns how many fired."""
+        tick = int(now / self.resolution)
+        if tick <= self._tick:
+            if tick < self._tick:
+                self._tick = tick  # clock went backwards: just follow it
+            return 0
+        n = len(self.slots)
+        # a jump longer than a revolution visits every bucket once
+        first = self._tick + 1 if tick - self._tick < n else tick - n + 1
+        due = []
+        for t in range(first, tick + 1):
+            bucket = self.slots[t % n]
+            if not bucket:
+                continue
+            keep = []
+            for timer in bucket:
+                if timer.cancelled:
+                    self.pending -= 1
+                elif timer.deadline <= now:
+                    due.append(timer)
+                else:
+                    keep.append(timer)
+            self.slots[t % n] = keep
+        self._tick = tick
+        due.sort(key=lambda timer: timer.deadline)
+        for timer in due:
+            self.pending -= 1
+            if not timer.cancelled:
+                timer.callback()
+        return len(due)